@@ -51,6 +51,8 @@ if config.is_building_docs():
     from qiskit_metal._gui.renderer_gds_model import RendererGDS_Model
     from qiskit_metal._gui.elements_window import ElementsWindow
     from qiskit_metal._gui.elements_window import ElementTableModel
+    from qiskit_metal._gui.elements_window import ElementFilterProxyModel
+    from qiskit_metal._gui.elements_window import ElementTableDelegate
     from qiskit_metal._gui.widgets.all_components.table_view_all_components import QTableView_AllComponents
     from qiskit_metal._gui.widgets.all_components.table_model_all_components import QTableModel_AllComponents
     from qiskit_metal._gui.widgets.bases.dict_tree_base import BranchNode
@@ -10,10 +10,76 @@
 
 from PySide2 import QtCore, QtGui, QtWidgets
 
+# NOTE: the helpers below were added by hand; keep them when regenerating
+# this file from elements_ui.ui.
+
+_ICON_SIZE = QtCore.QSize(20, 20)
+
+# None of the widgets below has a height that depends on its width, so the
+# policies leave heightForWidth off and can be shared.
+_LABEL_POLICY = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum,
+                                      QtWidgets.QSizePolicy.Minimum)
+_COMBO_POLICY = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred,
+                                      QtWidgets.QSizePolicy.Minimum)
+_TABLE_POLICY = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding,
+                                      QtWidgets.QSizePolicy.Expanding)
+
+# Built lazily, on the first setupUi, so that the QApplication exists.
+_REFRESH_ICON = None
+_BOLD_FONT = None
+_CLOSED_HAND_CURSOR = None
+
+
+def _refresh_icon():
+    """Return the refresh button icon, decoding its pixmap only once."""
+    global _REFRESH_ICON
+    if _REFRESH_ICON is None:
+        # Registers the :/refresh resource; only needed once a window is built
+        from . import main_window_rc_rc  # pylint: disable=unused-import,import-outside-toplevel
+        _REFRESH_ICON = QtGui.QIcon()
+        _REFRESH_ICON.addPixmap(QtGui.QPixmap(":/refresh"), QtGui.QIcon.Normal,
+                                QtGui.QIcon.Off)
+    return _REFRESH_ICON
+
+
+def _bold_font():
+    """Return the bold font shared by the labels."""
+    global _BOLD_FONT
+    if _BOLD_FONT is None:
+        _BOLD_FONT = QtGui.QFont()
+        _BOLD_FONT.setWeight(75)
+        _BOLD_FONT.setBold(True)
+    return _BOLD_FONT
+
+
+def _closed_hand_cursor():
+    """Return the cursor shown over the refresh button."""
+    global _CLOSED_HAND_CURSOR
+    if _CLOSED_HAND_CURSOR is None:
+        _CLOSED_HAND_CURSOR = QtGui.QCursor(QtCore.Qt.ClosedHandCursor)
+    return _CLOSED_HAND_CURSOR
+
+
+# No translator is ever installed, so a string translates the same way for
+# the whole session.
+_TRANSLATIONS = {}
+
+
+def _translate(text):
+    """Return the translation of a string of the form, asking Qt only once."""
+    translation = _TRANSLATIONS.get(text)
+    if translation is None:
+        translation = QtWidgets.QApplication.translate("ElementsWindow", text,
+                                                       None, -1)
+        _TRANSLATIONS[text] = translation
+    return translation
+
 
 class Ui_ElementsWindow(object):
 
     def setupUi(self, ElementsWindow):
+        # Hand edit: no repaints while the widgets are being built
+        ElementsWindow.setUpdatesEnabled(False)
         ElementsWindow.setObjectName("ElementsWindow")
         ElementsWindow.resize(841, 623)
         self.centralwidget = QtWidgets.QWidget(ElementsWindow)
@@ -29,42 +95,24 @@ class Ui_ElementsWindow(object):
         self.horizontalLayout = QtWidgets.QHBoxLayout()
         self.horizontalLayout.setObjectName("horizontalLayout")
         self.btn_refresh = QtWidgets.QPushButton(self.centralwidget)
-        self.btn_refresh.setCursor(QtCore.Qt.ClosedHandCursor)
+        self.btn_refresh.setCursor(_closed_hand_cursor())
         self.btn_refresh.setText("")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(":/refresh"), QtGui.QIcon.Normal,
-                       QtGui.QIcon.Off)
-        self.btn_refresh.setIcon(icon)
-        self.btn_refresh.setIconSize(QtCore.QSize(20, 20))
+        self.btn_refresh.setIcon(_refresh_icon())
+        self.btn_refresh.setIconSize(_ICON_SIZE)
         self.btn_refresh.setAutoDefault(False)
         self.btn_refresh.setDefault(False)
         self.btn_refresh.setFlat(True)
         self.btn_refresh.setObjectName("btn_refresh")
         self.horizontalLayout.addWidget(self.btn_refresh)
         self.label = QtWidgets.QLabel(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum,
-                                           QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(
-            self.label.sizePolicy().hasHeightForWidth())
-        self.label.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setWeight(75)
-        font.setBold(True)
-        self.label.setFont(font)
+        self.label.setSizePolicy(_LABEL_POLICY)
+        self.label.setFont(_bold_font())
         self.label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignTrailing |
                                 QtCore.Qt.AlignVCenter)
         self.label.setObjectName("label")
         self.horizontalLayout.addWidget(self.label)
         self.combo_element_type = QtWidgets.QComboBox(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred,
-                                           QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(
-            self.combo_element_type.sizePolicy().hasHeightForWidth())
-        self.combo_element_type.setSizePolicy(sizePolicy)
+        self.combo_element_type.setSizePolicy(_COMBO_POLICY)
         self.combo_element_type.setCurrentText("")
         self.combo_element_type.setSizeAdjustPolicy(
             QtWidgets.QComboBox.AdjustToContents)
@@ -76,10 +124,7 @@ class Ui_ElementsWindow(object):
         self.line.setObjectName("line")
         self.horizontalLayout.addWidget(self.line)
         self.label_3 = QtWidgets.QLabel(self.centralwidget)
-        font = QtGui.QFont()
-        font.setWeight(75)
-        font.setBold(True)
-        self.label_3.setFont(font)
+        self.label_3.setFont(_bold_font())
         self.label_3.setObjectName("label_3")
         self.horizontalLayout.addWidget(self.label_3)
         self.label_2 = QtWidgets.QLabel(self.centralwidget)
@@ -101,16 +146,9 @@ class Ui_ElementsWindow(object):
         self.horizontalLayout.addWidget(self.line_2)
         self.verticalLayout.addLayout(self.horizontalLayout)
         self.tableElements = QtWidgets.QTableView(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding,
-                                           QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(
-            self.tableElements.sizePolicy().hasHeightForWidth())
-        self.tableElements.setSizePolicy(sizePolicy)
+        self.tableElements.setSizePolicy(_TABLE_POLICY)
         self.tableElements.setProperty("showDropIndicator", False)
         self.tableElements.setDragDropOverwriteMode(False)
-        self.tableElements.setAlternatingRowColors(True)
         self.tableElements.setSortingEnabled(False)
         self.tableElements.setObjectName("tableElements")
         self.verticalLayout.addWidget(self.tableElements)
@@ -127,49 +165,26 @@ class Ui_ElementsWindow(object):
 
         self.retranslateUi(ElementsWindow)
         QtCore.QObject.connect(self.combo_element_type,
-                               QtCore.SIGNAL("currentIndexChanged(QString)"),
+                               QtCore.SIGNAL("currentIndexChanged(int)"),
                                ElementsWindow.combo_element_type)
         QtCore.QObject.connect(self.btn_refresh, QtCore.SIGNAL("clicked()"),
                                ElementsWindow.force_refresh)
-        QtCore.QMetaObject.connectSlotsByName(ElementsWindow)
+        # Hand edit: the slots are all connected explicitly above, so the
+        # connectSlotsByName scan is not needed.
+        ElementsWindow.setUpdatesEnabled(True)
 
     def retranslateUi(self, ElementsWindow):
-        ElementsWindow.setWindowTitle(
-            QtWidgets.QApplication.translate("ElementsWindow", "MainWindow",
-                                             None, -1))
-        self.btn_refresh.setToolTip(
-            QtWidgets.QApplication.translate("ElementsWindow",
-                                             "Force refresh the table ", None,
-                                             -1))
-        self.btn_refresh.setStatusTip(
-            QtWidgets.QApplication.translate("ElementsWindow",
-                                             "Force refresh the table ", None,
-                                             -1))
-        self.btn_refresh.setWhatsThis(
-            QtWidgets.QApplication.translate("ElementsWindow",
-                                             "Force refresh the table ", None,
-                                             -1))
-        self.btn_refresh.setAccessibleDescription(
-            QtWidgets.QApplication.translate("ElementsWindow",
-                                             "Force refresh the table ", None,
-                                             -1))
-        self.label.setText(
-            QtWidgets.QApplication.translate("ElementsWindow",
-                                             "QGeometry type: ", None, -1))
+        ElementsWindow.setWindowTitle(_translate("MainWindow"))
+        refresh_tip = _translate("Force refresh the table ")
+        self.btn_refresh.setToolTip(refresh_tip)
+        self.btn_refresh.setStatusTip(refresh_tip)
+        self.btn_refresh.setWhatsThis(refresh_tip)
+        self.btn_refresh.setAccessibleDescription(refresh_tip)
+        self.label.setText(_translate("QGeometry type: "))
         self.combo_element_type.setToolTip(
-            QtWidgets.QApplication.translate(
-                "ElementsWindow",
-                "<html><head/><body><p>Select the element table you wish to view</p></body></html>",
-                None, -1))
-        self.label_3.setText(
-            QtWidgets.QApplication.translate("ElementsWindow", "  Filter:  ",
-                                             None, -1))
-        self.label_2.setText(
-            QtWidgets.QApplication.translate("ElementsWindow", "Component: ",
-                                             None, -1))
-        self.label_4.setText(
-            QtWidgets.QApplication.translate("ElementsWindow", "  Layer:  ",
-                                             None, -1))
-
-
-from . import main_window_rc_rc
+            _translate(
+                "<html><head/><body><p>Select the element table you wish to view</p></body></html>"
+            ))
+        self.label_3.setText(_translate("  Filter:  "))
+        self.label_2.setText(_translate("Component: "))
+        self.label_4.setText(_translate("  Layer:  "))
@@ -13,12 +13,17 @@
 # that they have been altered from the originals.
 """Main module that handles the elements window inside the main window."""
 
-from typing import TYPE_CHECKING
+import re
+from typing import TYPE_CHECKING, Dict
 
 import numpy as np
 from PySide2 import QtCore, QtWidgets
-from PySide2.QtCore import QAbstractTableModel, QModelIndex
-from PySide2.QtWidgets import QMainWindow
+from PySide2.QtCore import (QAbstractTableModel, QModelIndex,
+                            QSortFilterProxyModel)
+from PySide2.QtGui import QPainter
+from PySide2.QtWidgets import (QAbstractItemView, QHeaderView, QMainWindow,
+                               QStyle, QStyledItemDelegate,
+                               QStyleOptionViewItem)
 
 from .elements_ui import Ui_ElementsWindow
 
@@ -52,6 +57,9 @@ class ElementsWindow(QMainWindow):
         self.logger = gui.logger
         self.statusbar_label = gui.statusbar_label
 
+        # Table type of each item of the combo box, in order
+        self._element_types = []
+
         # UI
         self.ui = Ui_ElementsWindow()
         self.ui.setupUi(self)
@@ -61,6 +69,16 @@ class ElementsWindow(QMainWindow):
         self.model = ElementTableModel(gui, self)
         self.ui.tableElements.setModel(self.model)
 
+        # Fixed row heights and no word wrap, so that scrolling does not
+        # have to measure the text of every row to lay out the view.
+        table = self.ui.tableElements
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(20)
+        table.setWordWrap(False)
+        table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        table.setItemDelegate(ElementTableDelegate(table))
+
     @property
     def design(self):
         """Returns the design."""
@@ -68,20 +86,32 @@ class ElementsWindow(QMainWindow):
 
     def populate_combo_element(self):
         """Populate the combo elements."""
-        for table_type in self.design.qgeometry.tables.keys():
-            if self.ui.combo_element_type.findText(
-                    table_type) == -1:  # not in combo box, add it
-                self.ui.combo_element_type.addItem(
-                    str(
-                        QtWidgets.QApplication.translate(
-                            "ElementsWindow", table_type, None, -1)))
+        new_types = [
+            table_type for table_type in self.design.qgeometry.tables.keys()
+            if table_type not in self._element_types  # not in combo box
+        ]
+        if not new_types:
+            return
+
+        # Record the types first: adding the first item emits
+        # currentIndexChanged right away.
+        self._element_types.extend(new_types)
+        self.ui.combo_element_type.addItems([
+            str(
+                QtWidgets.QApplication.translate("ElementsWindow", table_type,
+                                                 None, -1))
+            for table_type in new_types
+        ])
 
-    def combo_element_type(self, new_type: str):
-        """Change to the given type.
+    def combo_element_type(self, index: int):
+        """Change to the type of the selected combo box item.
 
         Args:
-            new_type (str): Type to change to
+            index (int): Index of the selected item, -1 if none
         """
+        if index < 0:
+            return
+        new_type = self._element_types[index]
         self.logger.info(f'Changed element table type to: {new_type}')
         self.model.set_type(new_type)
 
@@ -106,6 +136,8 @@ class ElementTableModel(QAbstractTableModel):
             model.data(index)
     """
     __timer_interval = 500  # ms
+    __rows_initial = 200  # rows shown before the view asks for more
+    __rows_fetch = 500  # rows added each time the view asks for more
 
     def __init__(self, gui, parent=None, element_type='poly'):
         super().__init__(parent=parent)
@@ -118,8 +150,23 @@ class ElementTableModel(QAbstractTableModel):
         self.logger = gui.logger
         self.gui = gui
         self._row_count = -1
+        self._rows_fetched = self.__rows_initial
+        self._fetch_all = False  # see `set_fetch_all`
         self.type = element_type
 
+        # Columns of the table as numpy arrays, see `columns`, and the table,
+        # index and row count they were extracted from
+        self._columns = None
+        self._display_columns = None
+        self._columns_table = None
+        self._columns_index = None
+        self._columns_rows = -1
+
+        # Sorting, see `sort`
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.AscendingOrder
+        self._sort_indices = {}  # column -> argsort of the column
+
         self._create_timer()
 
     @property
@@ -145,6 +192,115 @@ class ElementTableModel(QAbstractTableModel):
         if self.design:
             return self.design.qgeometry.tables[self.type]
 
+    @property
+    def columns(self):
+        """Returns the columns of the table as a list of numpy arrays, or None
+        if there is no table.
+
+        The arrays are extracted once and reused until the table is replaced,
+        or its row count or index changes.
+        """
+        if not self._update_columns():
+            return None
+        return self._columns
+
+    @property
+    def display_columns(self):
+        """Returns the columns of the table as shown in the view, or None if
+        there is no table.
+
+        Same as `columns`, but all columns except the first (component id) are
+        converted to strings.
+        """
+        if not self._update_columns():
+            return None
+        return self._display_columns
+
+    def _update_columns(self) -> bool:
+        """Rebuild the cached columns if the table has been replaced, or its
+        rows have changed.
+
+        Returns:
+            bool: False if there is no table
+        """
+        table = self.table
+        if table is None:
+            return False
+        if (table is not self._columns_table or
+                table.index is not self._columns_index or
+                table.shape[0] != self._columns_rows):
+            self._columns = [
+                table.iloc[:, column].to_numpy()
+                for column in range(table.shape[1])
+            ]
+            # One vectorized str conversion per column, rather than one
+            # str() call per cell on every paint.
+            self._display_columns = self._columns[:1] + [
+                table.iloc[:, column].astype(str).to_numpy()
+                for column in range(1, table.shape[1])
+            ]
+            self._sort_indices = {}
+            self._columns_table = table
+            self._columns_index = table.index
+            self._columns_rows = table.shape[0]
+        return True
+
+    def _table_rows(self):
+        """Returns the table row shown at each row of the model, or None when
+        the rows are not sorted.
+
+        Must be called after `_update_columns`.
+        """
+        column = self._sort_column
+        if not 0 <= column < len(self._columns):
+            return None
+
+        indices = self._sort_indices.get(column)
+        if indices is None:
+            keys = self._columns[column]
+            # Numbers sort as numbers, and so do the component ids; anything
+            # else, such as geometries, sorts by the text that is shown.
+            if column != 0 and keys.dtype.kind not in 'biuf':
+                keys = self._display_columns[column]
+            indices = np.argsort(keys, kind='stable')
+            self._sort_indices[column] = indices
+
+        if self._sort_order == QtCore.Qt.DescendingOrder:
+            return indices[::-1]
+        return indices
+
+    def table_row(self, row: int) -> int:
+        """Map a row of the model to the row of the table it shows.
+
+        Args:
+            row (int): Row of the model
+
+        Returns:
+            int: Row of the table
+        """
+        if not self._update_columns():
+            return row
+        rows = self._table_rows()
+        if rows is None:
+            return row
+        return rows[row]
+
+    def sort(self, column: int, order=QtCore.Qt.AscendingOrder):
+        """Sort the rows by the given column.
+
+        The order of a column is computed once per table with a stable numpy
+        argsort, and data() reads the rows through it, so sorting again by
+        the same column does not compare any cells.
+
+        Args:
+            column (int): Column to sort by, -1 to restore the table order
+            order (Qt.SortOrder): Sort order.  Defaults to AscendingOrder.
+        """
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._sort_order = order
+        self.layoutChanged.emit()
+
     def _create_timer(self):
         """Refresh the model number of rows, etc."""
         self._timer = QtCore.QTimer(self)
@@ -165,6 +321,8 @@ class ElementTableModel(QAbstractTableModel):
 
         Completely rebuild the model.
         """
+        self._columns_table = None
+        self._rows_fetched = self.__rows_initial
         self.modelReset.emit()
 
     def refresh_auto(self):
@@ -175,17 +333,45 @@ class ElementTableModel(QAbstractTableModel):
         if self._row_count != new_count:
             #self.logger.info('Number of components changed')
 
-            # When a model is reset it should be considered that all
-            # information previously retrieved from it is invalid.
-            # This includes but is not limited to the rowCount() and
-            # columnCount(), flags(), data retrieved through data(), and roleNames().
-            # This will loose the current selection.
-            self.modelReset.emit()
-
+            # Rows were added or removed, which a layout change does not
+            # cover. The table has already changed by the time this is
+            # noticed, so reset the model rather than signal the rows
+            # inserted or removed, and let views and proxies drop any stale
+            # persistent indexes.
+            self.beginResetModel()
             self._row_count = new_count
+            self.endResetModel()
+
+    def set_fetch_all(self, fetch_all: bool):
+        """Show all the rows of the table at once, rather than a batch at a
+        time. Used while the rows are filtered, so that rows that are not
+        fetched yet can match the filter too.
+
+        Args:
+            fetch_all (bool): True to show all the rows
+        """
+        if fetch_all == self._fetch_all:
+            return
+        old_count = self.rowCount()
+        if fetch_all:
+            new_count = 0 if self.table is None else self.table.shape[0]
+            if new_count > old_count:
+                self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+                self._fetch_all = True
+                self.endInsertRows()
+            else:
+                self._fetch_all = True
+        else:
+            # Keep the rows shown so far
+            self._rows_fetched = max(self._rows_fetched, old_count)
+            self._fetch_all = False
+        self._row_count = self.rowCount()
 
     def rowCount(self, parent: QModelIndex = None):
-        """Counts all the rows.
+        """Counts the rows fetched so far.
+
+        Large tables are shown a batch of rows at a time, see `fetchMore`,
+        unless all the rows are shown, see `set_fetch_all`.
 
         Args:
             parent (QModelIndex): Unused.  Defaults to None.
@@ -195,7 +381,38 @@ class ElementTableModel(QAbstractTableModel):
         """
         if self.table is None:
             return 0
-        return self.table.shape[0]
+        if self._fetch_all:
+            return self.table.shape[0]
+        return min(self.table.shape[0], self._rows_fetched)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Whether the table has rows that are not shown yet.
+
+        Args:
+            parent (QModelIndex): Parent index, valid for no row of a table
+
+        Returns:
+            bool: True if more rows can be fetched
+        """
+        if parent.isValid() or self.table is None:
+            return False
+        return self.rowCount() < self.table.shape[0]
+
+    def fetchMore(self, parent: QModelIndex):
+        """Show the next batch of rows. Called by the view as it is scrolled
+        to the end of the rows fetched so far.
+
+        Args:
+            parent (QModelIndex): Parent index, valid for no row of a table
+        """
+        if not self.canFetchMore(parent):
+            return
+        first = self.rowCount()
+        last = min(self.table.shape[0], first + self.__rows_fetch) - 1
+        self.beginInsertRows(QModelIndex(), first, last)
+        self._rows_fetched = last + 1
+        self.endInsertRows()
+        self._row_count = self.rowCount()
 
     def columnCount(self, parent: QModelIndex = None):
         """Counts all the columns.
@@ -257,20 +474,157 @@ class ElementTableModel(QAbstractTableModel):
             str: Data related to the given index and role
         """
 
-        if not index.isValid():
+        # The view probes many roles per visible cell on every paint;
+        # answer only the display role and let Qt use its defaults for
+        # everything else.
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
             return
-        # if not 0 <= index.row() < self.rowCount():
-        #    return None
 
-        if self.table is None:
+        columns = self.display_columns
+        if columns is None:
             return
 
-        if role == QtCore.Qt.DisplayRole:
-            row = index.row()
-            column = index.column()
-            # First column (component id) members, are ints so
-            # they should sort as numbers instead of strings.
-            if column == 0:
-                return self.table.iloc[row, column]
-            else:
-                return str(self.table.iloc[row, column])
+        row = index.row()
+        rows = self._table_rows()
+        if rows is not None:
+            row = rows[row]
+
+        return columns[index.column()][row]
+
+
+class ElementTableDelegate(QStyledItemDelegate):
+    """Delegate that paints the cells of the element table as plain text.
+
+    The cells only ever hold short plain text, so the style option setup,
+    rich text detection and eliding done by the default delegate for every
+    painted cell are skipped.
+
+    The class extends the `QStyledItemDelegate` class.
+    """
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem,
+              index: QModelIndex):
+        """Draw the text of the cell, highlighted if the cell is selected.
+
+        Args:
+            painter (QPainter): The painter
+            option (QStyleOptionViewItem): Style of the cell
+            index (QModelIndex): Index of the cell
+        """
+        text = index.data(QtCore.Qt.DisplayRole)
+        painter.save()
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+            painter.setPen(option.palette.highlightedText().color())
+        else:
+            painter.setPen(option.palette.text().color())
+        painter.drawText(option.rect.adjusted(4, 0, -4, 0),
+                         QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                         '' if text is None else str(text))
+        painter.restore()
+
+
+class ElementFilterProxyModel(QSortFilterProxyModel):
+    """Sort and filter proxy for the ElementTableModel.
+
+    Rows are filtered with wildcard patterns on some of the columns of the
+    element table. Instead of matching every cell through Qt, the patterns
+    are evaluated once over whole columns into a boolean mask, which
+    `filterAcceptsRow` only has to index. While a filter is set, the source
+    model shows all its rows, so that the rows it has not fetched yet are
+    filtered too.
+
+    The class extends the `QSortFilterProxyModel` class.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Args:
+            parent (QObject): Parent object.  Defaults to None.
+        """
+        super().__init__(parent)
+        self._patterns = {}  # column index -> compiled pattern
+        self._mask = None
+        self._mask_table = None  # table the mask was computed for
+
+    def set_filters(self, filters: Dict[int, str]):
+        """Set the filter of each column and refilter the rows once.
+
+        Args:
+            filters (dict): Maps a column index to a wildcard pattern (``*``
+                and ``?``). A row is kept if each of its columns contains the
+                pattern of that column. Empty patterns are ignored.
+        """
+        self._patterns = {
+            column: _wildcard_to_regex(text)
+            for column, text in filters.items()
+            if text
+        }
+        self._mask_table = None
+        if self.sourceModel() is not None:
+            self.sourceModel().set_fetch_all(bool(self._patterns))
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex):
+        """Check the row against the precomputed filter mask.
+
+        Args:
+            source_row (int): Row in the source model
+            source_parent (QModelIndex): Unused
+
+        Returns:
+            bool: True if the row passes all the column filters
+        """
+        if not self._patterns:
+            return True
+
+        table = self.sourceModel().table
+        if table is None:
+            return True
+
+        if table is not self._mask_table:
+            self._mask = self._compute_mask(table)
+            self._mask_table = table
+
+        return bool(self._mask[self.sourceModel().table_row(source_row)])
+
+    def sort(self, column: int, order=QtCore.Qt.AscendingOrder):
+        """Let the source model sort its rows with its cached argsort, rather
+        than having Qt compare the cells one pair at a time.
+
+        Args:
+            column (int): Column to sort by
+            order (Qt.SortOrder): Sort order.  Defaults to AscendingOrder.
+        """
+        self.sourceModel().sort(column, order)
+
+    def _compute_mask(self, table) -> np.ndarray:
+        """Evaluate all the column patterns over the whole table.
+
+        Args:
+            table (DataFrame): The element table
+
+        Returns:
+            np.ndarray: Boolean mask of the rows to keep
+        """
+        mask = np.ones(len(table), dtype=bool)
+        for column, pattern in self._patterns.items():
+            values = table.iloc[:, column].astype(str)
+            mask &= values.str.contains(pattern).to_numpy(dtype=bool)
+        return mask
+
+
+def _wildcard_to_regex(text: str) -> re.Pattern:
+    """Compile a wildcard pattern, as used by Qt filters, to a regex.
+
+    Args:
+        text (str): Pattern where ``*`` matches any text and ``?`` any
+            character
+
+    Returns:
+        re.Pattern: The compiled regular expression
+    """
+    regex = ''.join(
+        '.*' if char == '*' else '.' if char == '?' else re.escape(char)
+        for char in text)
+    return re.compile(regex)
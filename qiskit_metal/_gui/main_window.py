@@ -32,7 +32,6 @@ from qiskit_metal._gui.widgets.qlibrary_display.proxy_model_qlibrary import \
 
 from .. import config, qlibrary
 from ..designs.design_base import QDesign
-from .elements_window import ElementsWindow
 from .net_list_window import NetListWindow
 from .main_window_base import (QMainWindowBaseHandler, QMainWindowExtensionBase,
                                kick_start_qApp)
@@ -56,6 +55,7 @@ if not config.is_building_docs():
 
 if TYPE_CHECKING:
     from ..renderers.renderer_mpl.mpl_canvas import PlotCanvas
+    from .elements_window import ElementsWindow
 
 
 class QMainWindowExtension(QMainWindowExtensionBase):
@@ -311,7 +311,7 @@ class MetalGUI(QMainWindowBaseHandler):
 
         # UIs
         self.plot_win = None  # type: QMainWindowPlot
-        self.elements_win = None  # type: ElementsWindow
+        self._elements_win = None  # type: ElementsWindow
         self.net_list_win = None  # type: NetListWindow
         self.component_window = ComponentWidget(self, self.ui.dockComponent)
         self.variables_window = PropertyTableWidget(self, gui=self)
@@ -371,7 +371,8 @@ class MetalGUI(QMainWindowBaseHandler):
         ]
         setEnabled(self.ui, widgets)
 
-        widgets = ['component_window', 'elements_win', 'net_list_win']
+        # _elements_win: don't create the Elements window just to disable it
+        widgets = ['component_window', '_elements_win', 'net_list_win']
         setEnabled(self, widgets)
 
     def set_design(self, design: QDesign):
@@ -386,7 +387,8 @@ class MetalGUI(QMainWindowBaseHandler):
         self._set_enabled_design_widgets(True)
 
         self.plot_win.set_design(design)
-        self.elements_win.force_refresh()
+        if self._elements_win:
+            self._elements_win.force_refresh()
         self.net_list_win.force_refresh()
 
         if self.main_window.gds_gui:
@@ -555,20 +557,53 @@ class MetalGUI(QMainWindowBaseHandler):
         dock.show()
         dock.setMaximumHeight(99999)
 
+    @property
+    def elements_win(self) -> 'ElementsWindow':
+        """The main Window Elements Widget, created the first time it is
+        needed."""
+        if self._elements_win is None:
+            self._create_elements_widget()
+        return self._elements_win
+
     def _setup_elements_widget(self):
+        """Defer the creation of the main Window Elements Widget until its tab
+        is first shown, or until `elements_win` is first accessed."""
+        if self.ui.tabWidget.currentWidget() is self.ui.tabQGeometry:
+            self._create_elements_widget()
+        else:
+            self.ui.tabWidget.currentChanged.connect(self._elements_tab_changed)
+
+    def _elements_tab_changed(self, index: int):
+        """Create the Elements Widget the first time its tab is shown.
+
+        Args:
+            index (int): Index of the tab that became current.
+        """
+        if self.ui.tabWidget.widget(index) is not self.ui.tabQGeometry:
+            return
+        self.ui.tabWidget.currentChanged.disconnect(self._elements_tab_changed)
+        if self._elements_win is None:
+            self._create_elements_widget()
+
+    def _create_elements_widget(self):
         """Create main Window Elements Widget."""
-        self.elements_win = ElementsWindow(self, self.main_window)
+        from .elements_window import ElementFilterProxyModel, ElementsWindow
+        self._elements_win = ElementsWindow(self, self.main_window)
 
-        # Component filter
-        self.ui.tabQGeometry.sort_model = QSortFilterProxyModel()
+        # Component and Layer filters
+        self.ui.tabQGeometry.sort_model = ElementFilterProxyModel()
         self.ui.tabQGeometry.sort_model.setSourceModel(self.elements_win.model)
-        self.ui.tabQGeometry.sort_model.setFilterKeyColumn(1)
 
         self.elements_win.ui.tableElements.setModel(
             self.ui.tabQGeometry.sort_model)
         self.elements_win.ui.tableElements.setSortingEnabled(True)
 
-        # Add a text changed event to the QGeometry/Component/Layer text boxes
+        # Add a text changed event to the QGeometry/Component/Layer text boxes.
+        # The filter is applied once typing pauses, not on every key stroke.
+        self._elements_filter_timer = QTimer(self.main_window)
+        self._elements_filter_timer.setSingleShot(True)
+        self._elements_filter_timer.setInterval(150)
+        self._elements_filter_timer.timeout.connect(self._apply_elements_filter)
         self.elements_win.ui.lineEdit.textChanged.connect(
             self.elements_lineEdit_onChanged)
         self.elements_win.ui.lineEdit_2.textChanged.connect(
@@ -577,21 +612,32 @@ class MetalGUI(QMainWindowBaseHandler):
         # Add to the tabbed main view
         self.ui.tabQGeometry.layout().addWidget(self.elements_win)
 
+        if self.design:
+            self.elements_win.force_refresh()
+        else:
+            self.elements_win.setEnabled(False)
+
     def elements_lineEdit_onChanged(self, text):
         """ Text changed event for QGeometry/Component text box
         Args:
             text: Text typed in the filter box.
         """
-        self.ui.tabQGeometry.sort_model.setFilterKeyColumn(1)
-        self.ui.tabQGeometry.sort_model.setFilterWildcard(text)
+        self._elements_filter_timer.start()
 
     def elements_lineEdit_2_onChanged(self, text):
         """ Text changed event for QGeometry/Layer text box
         Args:
             text: Text typed in the filter box.
         """
-        self.ui.tabQGeometry.sort_model.setFilterKeyColumn(3)
-        self.ui.tabQGeometry.sort_model.setFilterWildcard(text)
+        self._elements_filter_timer.start()
+
+    def _apply_elements_filter(self):
+        """Filter the QGeometry table with the text of both its Component and
+        Layer filter boxes."""
+        self.ui.tabQGeometry.sort_model.set_filters({
+            1: self.elements_win.ui.lineEdit.text(),
+            3: self.elements_win.ui.lineEdit_2.text()
+        })
 
     def _setup_net_list_widget(self):
         """Create main Window Elements Widget."""
@@ -17,13 +17,11 @@ Tree model for Param Entry Window
 
 import builtins
 import json
-import queue
 from collections import OrderedDict
 from typing import Union, TYPE_CHECKING, Any
 
 import numpy as np
-from PySide2 import QtCore
-from PySide2.QtCore import QAbstractItemModel, QModelIndex, QTimer, Qt
+from PySide2.QtCore import QAbstractItemModel, QModelIndex, Qt
 from PySide2.QtGui import QFont
 from PySide2.QtWidgets import (QComboBox, QTreeView, QWidget)
 from addict import Dict
@@ -31,36 +29,8 @@ from addict import Dict
 if TYPE_CHECKING:
     from qiskit_metal.designs.design_base import QDesign
 
-
-def get_nested_dict_item(dic: dict, key_list: list):
-    """
-    Get a nested dictionary item.
-    If key_list is empty, return dic itself.
-
-    Args:
-        dic (dict): dictionary of items
-        key_list (list): list of keys
-
-    Returns:
-        dict: nested dictionary
-
-    .. code-block:: python
-        :linenos:
-
-        myDict = Dict(aa=Dict(x1={'dda':34},y1='Y',z='10um'),
-            bb=Dict(x2=5,y2='YYYsdg',z='100um'))
-        key_list = ['aa', 'x1', 'dda']
-        [get_dict_item](myDict, key_list)
-        returns 34
-
-    """
-    if key_list:
-        for k in key_list:
-            if k not in dic:
-                raise Exception(f"CANAOT FIND ERROR{k} not in {dic}!!! :( ")
-            dic = dic[k]
-
-    return dic
+# Values of these types (and their subclasses) become branches of the tree
+_BRANCH_TYPES = (dict, OrderedDict, Dict)
 
 
 class Node:  # pylint: disable=too-few-public-methods
@@ -79,6 +49,8 @@ class BranchNode(Node):
     The list of children consists of tuple pairs of the form (nodename_i, node_i),
     where the former is the name of the child node and the latter is the child node itself.
     KEY (=0) and NODE (=1) identify their respective positions within each tuple pair.
+    The children are also indexed by name and by node, so that looking one up does
+    not scan the list; call `reindex` after changing the list directly.
 
     """
 
@@ -93,7 +65,12 @@ class BranchNode(Node):
         self.name = name
         self.parent = parent
         self.children = []
+        self._by_name = {}  # name -> first child with that name
+        self._row_of = {}  # child node -> row
         self.type = cur_type.__name__
+        # Dictionary whose items are not turned into child nodes yet,
+        # see TreeModelParamEntry.fetchMore
+        self.pending_dict = None
 
     def update_name(self, new_name):
         """ Updates name """
@@ -180,10 +157,7 @@ class BranchNode(Node):
         Returns:
             int: Row of the given child.  -1 is returned if the child is not found.
         """
-        for i, (_, childnode) in enumerate(self.children):
-            if child == childnode:
-                return i
-        return -1
+        return self._row_of.get(child, -1)
 
     def childWithKey(self, key: str):  # pylint: disable=invalid-name
         """Gets the child with the given key
@@ -195,10 +169,7 @@ class BranchNode(Node):
             Node: The child with the same name as the given key.
             None is returned if the child is not found
         """
-        for childname, childnode in self.children:
-            if key == childname:
-                return childnode
-        return None
+        return self._by_name.get(key)
 
     def insertChild(self, child):  # pylint: disable=invalid-name
         """
@@ -209,11 +180,39 @@ class BranchNode(Node):
         """
         child.parent = self
         self.children.append((child.name, child))
+        self._by_name.setdefault(child.name, child)
+        self._row_of[child] = len(self.children) - 1
+
+    def removeChild(self, row: int):  # pylint: disable=invalid-name
+        """Remove the child at the given row
+
+        Args:
+            row (int): the row
+        """
+        name, node = self.children.pop(row)
+        del self._row_of[node]
+        for later_row in range(row, len(self.children)):
+            self._row_of[self.children[later_row][self.NODE]] = later_row
+        if self._by_name.get(name) is node:
+            del self._by_name[name]
+            for childname, childnode in self.children:
+                if childname == name:
+                    self._by_name[name] = childnode
+                    break
 
     def update_child(self, child_node):
         """ Updates child"""
         row = self.rowOfChild(child_node)
         self.children[row] = (child_node.name, child_node)
+        self.reindex()
+
+    def reindex(self):
+        """Rebuild the lookups by name and by node from the list of children"""
+        self._by_name = {}
+        self._row_of = {}
+        for row, (childname, childnode) in enumerate(self.children):
+            self._by_name.setdefault(childname, childnode)
+            self._row_of[childnode] = row
 
     def hasLeaves(self):  # pylint: disable=invalid-name
         """Do I have leaves?
@@ -226,6 +225,17 @@ class BranchNode(Node):
         return isinstance(self.children[self.KEY][self.NODE], LeafNode)
 
 
+def _has_leaf(dic: dict) -> bool:
+    """Whether a nested dictionary holds at least one value that is not itself
+    a dictionary"""
+    for value in dic.values():
+        if not isinstance(value, _BRANCH_TYPES):
+            return True
+        if _has_leaf(value):
+            return True
+    return False
+
+
 class NpEncoder(json.JSONEncoder):
     """Helper Class for data transfer"""
 
@@ -241,6 +251,31 @@ class NpEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+_TRUTHY = frozenset({'true', '1', 'yes', 'y', 'on'})
+
+
+def _parse_bool(text: str) -> bool:
+    """Parse the text of a bool leaf"""
+    return text.strip().lower() in _TRUTHY
+
+
+def _to_json(value: Any) -> str:
+    """Text of a list or ndarray leaf"""
+    return json.dumps(value, cls=NpEncoder)
+
+
+# Type name of a leaf value -> (text to value, value to text).
+# Types that are not listed are parsed with the builtin of that name.
+_LEAF_TYPES = {
+    'str': (str, str),
+    'float': (float, str),
+    'int': (int, str),
+    'bool': (_parse_bool, str),
+    'ndarray': (lambda a: np.array(json.loads(a)), _to_json),
+    'list': (json.loads, _to_json),
+}
+
+
 class LeafNode(Node):
     """
     A LeafNode object has no children but consists of a key-value pair, denoted by
@@ -262,6 +297,11 @@ class LeafNode(Node):
         self.name = name
         self.type = type(value).__name__
         self.value = self._get_display_value(value)
+        # Last value parsed by the design, its text, and what it was parsed
+        # from: the value and the design variables
+        self._parsed_value = None
+        self._parsed_text = ''
+        self._parsed_from = None
 
     def get_type_combobox(self, parent: QWidget):
         """Return combobox"""
@@ -274,12 +314,12 @@ class LeafNode(Node):
         npArr = "ndarray"
         pylist = "list"
         customFromStringItems = {
-            npArr: lambda a: np.array(json.loads(a)),
-            pylist: lambda a: json.loads(a),  # pylint: disable=unnecessary-lambda
+            npArr: _LEAF_TYPES[npArr][0],
+            pylist: _LEAF_TYPES[pylist][0],
         }
         customToStringItems = {
-            npArr: lambda a: json.dumps(a, cls=NpEncoder),
-            pylist: lambda a: json.dumps(a, cls=NpEncoder),
+            npArr: _LEAF_TYPES[npArr][1],
+            pylist: _LEAF_TYPES[pylist][1],
         }
 
         def __init__(self, parent=None):
@@ -296,12 +336,13 @@ class LeafNode(Node):
             self.np_enc = NpEncoder
 
         def getType(self):  # pylint: disable=invalid-name
-            """Return type"""
-            if self.currentText() in self.customFromStringItems:
-
-                return self.customFromStringItems[self.currentText()]
-
-            return getattr(builtins, self.currentText())
+            """Return the function that parses the text of a value of the
+            selected type"""
+            type_name = self.currentText()
+            converters = _LEAF_TYPES.get(type_name)
+            if converters is None:
+                return getattr(builtins, type_name)
+            return converters[0]
 
         def getTypeName(self):  # pylint: disable=invalid-name
             """Return name"""
@@ -309,27 +350,48 @@ class LeafNode(Node):
 
     def _get_display_value(self, value):
         """Return display value """
-
-        if self.type in self.LeafTypeComboBox.customToStringItems:
-            return self.LeafTypeComboBox.customToStringItems[self.type](value)
-        return str(value)
+        converters = _LEAF_TYPES.get(self.type)
+        if converters is None:
+            return str(value)
+        return converters[1](value)
 
     def get_real_value(self):
         """Return real value"""
-        if self.type in self.LeafTypeComboBox.customFromStringItems:
-            val = self.LeafTypeComboBox.customFromStringItems[self.type](
-                self.value)
-            return val
-
-        cur_type = getattr(builtins, self.type)
-        if cur_type == bool:  # pylint: disable=simplifiable-if-statement
-            if self.value.lower() in "true":  # pylint: disable=simplifiable-if-statement
-                value = True
-            else:
-                value = False
-        else:
-            value = cur_type(self.value)
-        return value
+        converters = _LEAF_TYPES.get(self.type)
+        if converters is None:
+            return getattr(builtins, self.type)(self.value)
+        return converters[0](self.value)
+
+    def get_parsed_value(self, design: 'QDesign'):
+        """Return the value as parsed by the design.
+
+        Parsing is only done again when the value or the design variables,
+        which the value can refer to, have changed since the last call.
+
+        Args:
+            design (QDesign): The design that parses the value
+
+        Returns:
+            object: The parsed value
+        """
+        parsed_from = (self.value, tuple(design.variables.items()))
+        if self._parsed_from is None or self._parsed_from != parsed_from:
+            self._parsed_value = design.parse_value(self.value)
+            self._parsed_text = str(self._parsed_value)
+            self._parsed_from = parsed_from
+        return self._parsed_value
+
+    def get_parsed_text(self, design: 'QDesign') -> str:
+        """Return the text of the value as parsed by the design.
+
+        Args:
+            design (QDesign): The design that parses the value
+
+        Returns:
+            str: The parsed value as text
+        """
+        self.get_parsed_value(design)
+        return self._parsed_text
 
     def update_name(self, new_name):
         """Update name"""
@@ -353,7 +415,6 @@ class TreeModelParamEntry(QAbstractItemModel):
     Access using ``gui.component_window.model``.
     """
 
-    __refreshtime = 500  # 0.5 second refresh time
     NAME = 0
     VALUE = 1
     PARSED = 2
@@ -376,14 +437,44 @@ class TreeModelParamEntry(QAbstractItemModel):
             design (QDesign): Current design using the model
         """
         super().__init__(parent=parent)
-        self._rowCount = -1  # pylint: disable=invalid-name
         self.root = BranchNode('')
         self.view = view
         self._design = design
-        self.headers = ['Name', 'Value']
-        self._start_timer()
         self.headers = ['Name', 'Value', 'Parsed Value',
                         "Type"]  # 3 columns instead of 2
+        # data() is called for every visible cell on each repaint
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        self._align = int(Qt.AlignTop | Qt.AlignLeft)
+        self._role_handlers = {
+            Qt.DisplayRole:
+                self._data_display,
+            # The data in a form suitable for editing in an editor. (QString)
+            Qt.EditRole:
+                self._data_display,
+            Qt.FontRole:
+                self._data_font,
+            Qt.TextAlignmentRole:
+                self._data_align
+        }
+        # the first column is either a leaf key or a branch
+        # the second column is always a leaf value or for a branch is ''.
+        # A leaf value is kept as text (see LeafNode._get_display_value)
+        self._leaf_columns = {
+            self.NAME: lambda node: node.name,  # key
+            self.VALUE: lambda node: node.value,  # value
+            self.PARSED: lambda node: node.get_parsed_text(self._design),
+            self.TYPE: lambda node: node.type
+        }
+        self._branch_columns = {
+            self.NAME: lambda node: node.name,
+            self.TYPE: lambda node: node.type
+        }
+        # Branches expanded in the view, kept up to date from its signals
+        self._expanded_nodes = set()
+        if view is not None:
+            view.expanded.connect(self._on_expanded)
+            view.collapsed.connect(self._on_collapsed)
         if data_dict is None:
             data_dict = {}
         self.init_load(data_dict)
@@ -407,12 +498,8 @@ class TreeModelParamEntry(QAbstractItemModel):
         if isinstance(parent_node, LeafNode):
             parent_node = parent_node.parent
 
-        parent_node.insertChild(LeafNode(key, value, parent=parent_node))
-
-        cop = self.get_path_of_expanded_items()
-
-        self.reload()
-        self.expand_items_in_paths(cop)
+        self._fetch_children(parent_node)
+        self._insert_node(parent_node, LeafNode(key, value, parent=parent_node))
 
     def add_new_branch_node(self,
                             cur_index: QModelIndex,
@@ -434,11 +521,22 @@ class TreeModelParamEntry(QAbstractItemModel):
 
         new_node = BranchNode(key, parent_node)
         new_node.insertChild(LeafNode(fake_key, fake_value, new_node))
-        parent_node.insertChild(new_node)
-        cop = self.get_path_of_expanded_items()
+        self._fetch_children(parent_node)
+        self._insert_node(parent_node, new_node)
 
-        self.reload()
-        self.expand_items_in_paths(cop)
+    def _insert_node(self, parent_node: BranchNode, node: Node):
+        """
+        Append a node to the children of parent_node, telling the view about
+        the new row only, so that it keeps its expanded branches and selection.
+
+        Args:
+            parent_node (BranchNode): Parent of the new node
+            node (Node): The new node
+        """
+        row = len(parent_node.children)
+        self.beginInsertRows(self.indexFromNode(parent_node), row, row)
+        parent_node.insertChild(node)
+        self.endInsertRows()
 
     def delete_node(self, cur_index: QModelIndex):
         """
@@ -455,66 +553,32 @@ class TreeModelParamEntry(QAbstractItemModel):
 
             raise Exception("Don't delete the everything please")
 
-        # remove from parent
-        if (cur_node.name, cur_node) in cur_node.parent.children:
-
-            cur_node.parent.children.remove((cur_node.name, cur_node))
-
-            # cleaning up dangling branches
-            parent = old_parent = cur_node.parent
-            if len(parent.children) < 1:
-                while len(parent.children) < 2:
-                    old_parent = parent
-                    parent = old_parent.parent
-                    old_parent.children = []
-
-                if len(old_parent.children) < 1:
-                    parent.children.remove((old_parent.name, old_parent))
-
-        else:
+        if cur_node.parent.rowOfChild(cur_node) < 0:
             raise Exception(
                 "Internal Model Exception: unable to find parent of child node to be deleted."
             )
 
-        cop = self.get_path_of_expanded_items()
-
-        self.dataChanged.emit(cur_index, cur_index)
-        self.reload()
-        self.expand_items_in_paths(cop)
-
-    def _start_timer(self):
-        """
-        Start and continuously refresh timer in background to keep
-        the total number of rows up to date.
-        """
-        self.timer = QTimer(self)
-        self.timer.start(self.__refreshtime)
-        self.timer.timeout.connect(self.auto_refresh)
-
-    def auto_refresh(self):
-        """
-        Check to see if the total number of rows has been changed. If so,
-        completely rebuild the model and tree.
-        """
-        # TODO: Check if new nodes have been added; if so, rebuild model.
-        newRowCount = self.rowCount(self.createIndex(0, 0))  # pylint: disable=invalid-name
-        if self._rowCount != newRowCount:
-            self.modelReset.emit()
-            self._rowCount = newRowCount
-
-    def getPaths(self, curdict: OrderedDict, curpath: list):  # pylint: disable=invalid-name
-        """Recursively finds and saves all root-to-leaf paths in model"""
-
-        for k, v in curdict.items():
-            if type(v) in BranchNode.BranchTypeComboBox.branch_types:
-                self.getPaths(v, curpath + [k])
-            else:
-                self.paths.append(curpath + [k, v])
+        # cleaning up dangling branches: a branch left without children
+        # would be dropped, so remove the highest ancestor that holds
+        # nothing but the node being deleted.
+        node = cur_node
+        while node.parent is not self.root and len(node.parent.children) < 2:
+            node = node.parent
+        parent = node.parent
 
-    def reload(self):
-        """ Sends out a signal forcing QTreeView to completely refresh"""
-        self.beginResetModel()
-        self.endResetModel()
+        # remove from parent
+        row = parent.rowOfChild(node)
+        self.beginRemoveRows(self.indexFromNode(parent), row, row)
+        parent.removeChild(row)
+        self.endRemoveRows()
+
+        # forget the expanded branches that were removed
+        removed = [node]
+        while removed:
+            branch = removed.pop()
+            if isinstance(branch, BranchNode):
+                self._expanded_nodes.discard(branch)
+                removed.extend(child for _, child in branch.children)
 
     def init_load(self, data_dict: dict):
         """Builds a tree from a dictionary (data_dict)"""
@@ -525,36 +589,95 @@ class TreeModelParamEntry(QAbstractItemModel):
 
         # Clear existing tree paths if any
         self.root.children.clear()
+        self.root.reindex()
+        self._expanded_nodes.clear()
 
-        # Construct the paths -> sets self.paths
-        self.paths = []
-        self.getPaths(data_dict, [])
-        for path in self.paths:
-            root = self.root
-            branch = None
-            # Combine final name and value for leaf node,
-            # so stop at 2nd to last element of each path
-            for key in path[:-2]:
-                # Look for childnode with the name 'key'. If it's not found, create a new branch.
-                branch = root.childWithKey(key)
-                if not branch:
-                    dict_type = type(
-                        get_nested_dict_item(data_dict,
-                                             path[:path.index(key) + 1]))
-
-                    branch = BranchNode(key, parent=root, cur_type=dict_type)
-                    root.insertChild(branch)
-                root = branch
-            # If a LeafNode resides in the outermost dictionary, the above for loop is bypassed.
-            # [Note: This happens when the root-to-leaf path length is just 2.]
-            # In this case, add the LeafNode right below the master root.
-            # Otherwise, add the LeafNode below the final branch.
-            root.insertChild(LeafNode(path[-2], path[-1], parent=root))
+        for node in self._create_nodes(data_dict):
+            self.root.insertChild(node)
 
         # Emit a signal since the model's internal state
         # (e.g. persistent model indexes) has been invalidated.
         self.endResetModel()
 
+    def _create_nodes(self, data: dict) -> list:
+        """Create the nodes for the items of data, a nested dictionary.
+
+        Nested dictionaries become branches whose own items are only turned
+        into nodes when the branch is first expanded, see `fetchMore`.
+
+        Args:
+            data (dict): The items
+
+        Returns:
+            list: The new nodes, in the order of the items
+        """
+        nodes = []
+        for key, value in data.items():
+            if isinstance(value, _BRANCH_TYPES):
+                # Dictionaries that hold no leaf at all are left out
+                if _has_leaf(value):
+                    branch = BranchNode(key, cur_type=type(value))
+                    branch.pending_dict = value
+                    nodes.append(branch)
+            else:
+                nodes.append(LeafNode(key, value))
+        return nodes
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()):  # pylint: disable=invalid-name
+        """Whether the node has children, including ones not created yet
+
+        Args:
+            parent (QModelIndex): The parent
+
+        Returns:
+            bool: True if the node has children
+        """
+        node = self.nodeFromIndex(parent)
+        if not isinstance(node, BranchNode):
+            return False
+        return bool(node.children) or node.pending_dict is not None
+
+    def canFetchMore(self, parent: QModelIndex):  # pylint: disable=invalid-name
+        """Whether the children of the node still have to be created
+
+        Args:
+            parent (QModelIndex): The parent
+
+        Returns:
+            bool: True if fetchMore would add children
+        """
+        node = self.nodeFromIndex(parent)
+        return isinstance(node, BranchNode) and node.pending_dict is not None
+
+    def fetchMore(self, parent: QModelIndex):  # pylint: disable=invalid-name
+        """Create the children of a branch, the first time the view needs
+        them (usually when the branch is expanded).
+
+        Args:
+            parent (QModelIndex): The parent
+        """
+        if self.canFetchMore(parent):
+            self._fetch_children(self.nodeFromIndex(parent))
+
+    def _fetch_children(self, branch: BranchNode):
+        """Create the pending children of branch, if any, and tell the view.
+
+        Args:
+            branch (BranchNode): The branch
+        """
+        if branch.pending_dict is None:
+            return
+        nodes = self._create_nodes(branch.pending_dict)
+        branch.pending_dict = None
+        if not nodes:
+            return
+        first = len(branch.children)
+        self.beginInsertRows(self.indexFromNode(branch), first,
+                             first + len(nodes) - 1)
+        for node in nodes:
+            branch.insertChild(node)
+        self.endInsertRows()
+
     def rowCount(self, parent: QModelIndex):
         """Get the number of rows
 
@@ -586,7 +709,7 @@ class TreeModelParamEntry(QAbstractItemModel):
         """
         return len(self.headers)
 
-    def data(self, index: QModelIndex, role: Qt.ItemDataRole = Qt.DisplayRole):  # pylint: disable=too-many-return-statements,too-many-branches
+    def data(self, index: QModelIndex, role: Qt.ItemDataRole = Qt.DisplayRole):
         """Gets the node data
 
         Args:
@@ -598,45 +721,29 @@ class TreeModelParamEntry(QAbstractItemModel):
         """
         if not index.isValid():
             return None
+        handler = self._role_handlers.get(role)
+        return handler(index) if handler else None
 
-        # The data in a form suitable for editing in an editor. (QString)
-        if role == Qt.EditRole:
-            return self.data(index, Qt.DisplayRole)
-
-        # Bold the first
-        if (role == Qt.FontRole) and (index.column() == self.NAME):
-            font = QFont()
-            font.setBold(True)
-            return font
-
-        if role == Qt.TextAlignmentRole:
-            return int(Qt.AlignTop | Qt.AlignLeft)
-
-        if role == Qt.DisplayRole:
-            node = self.nodeFromIndex(index)
-            if node:
-                # the first column is either a leaf key or a branch
-                # the second column is always a leaf value or for a branch is ''.
-                if isinstance(node, BranchNode):
-                    # Handle a branch (which is a nested subdictionary, which can be expanded)
-                    if index.column() == self.NAME:
-                        return node.name
-                    if index.column() == self.TYPE:
-                        return node.type
-                    return ''
-                # We have a leaf
-                if index.column() == self.NAME:
-                    return str(node.name)  # key
-                if index.column() == self.VALUE:
-                    return str(node.value)  # value
-                if index.column() == self.PARSED:
-                    return str(self._design.parse_value(node.value))
-                if index.column() == self.TYPE:
-                    return node.type
-
-                return None
-
-        return None
+    def _data_display(self, index: QModelIndex):
+        """Text shown for the cell at index."""
+        node = self.nodeFromIndex(index)
+        if node is None:
+            return None
+        if isinstance(node, BranchNode):
+            # Handle a branch (which is a nested subdictionary, which can be expanded)
+            getter = self._branch_columns.get(index.column())
+            return getter(node) if getter else ''
+        # We have a leaf
+        getter = self._leaf_columns.get(index.column())
+        return getter(node) if getter else None
+
+    def _data_font(self, index: QModelIndex):
+        """Bold the first column."""
+        return self._bold_font if index.column() == self.NAME else None
+
+    def _data_align(self, index: QModelIndex):  # pylint: disable=unused-argument
+        """All cells are aligned top left."""
+        return self._align
 
     def setData(
             self,  # pylint: disable=too-many-return-statements
@@ -660,7 +767,7 @@ class TreeModelParamEntry(QAbstractItemModel):
             if not index.isValid():
                 return False
 
-            if role == QtCore.Qt.EditRole:
+            if role == Qt.EditRole:
 
                 if index.column(
                 ) == self.VALUE:  # only want to edit col1 if it's a leafnode
@@ -692,10 +799,9 @@ class TreeModelParamEntry(QAbstractItemModel):
 
                     node.update_name(value)
 
-                    cop = self.get_path_of_expanded_items()
-
+                    # The model is not reset, so the view keeps its
+                    # expanded branches.
                     self.dataChanged.emit(index, index)
-                    self.expand_items_in_paths(cop)
 
                     # update node
                     # at each parent:
@@ -707,10 +813,7 @@ class TreeModelParamEntry(QAbstractItemModel):
                         self.index(index.row(), 0, index.parent()))
                     node.type = value
 
-                    cop = self.get_path_of_expanded_items()
-
                     self.dataChanged.emit(index, index)
-                    self.expand_items_in_paths(cop)
                     return True
 
             return False
@@ -718,48 +821,15 @@ class TreeModelParamEntry(QAbstractItemModel):
             self._design.logger.error(f"Unable to parse tree information: {e}")
             return False
 
-    # persistentIndexList
-    def get_path_of_expanded_items(self):
-        """ Collect which nodes are currently expanded in
-        order to re-expand them after refreshing the model"""
-        expanded_nodes = []
-        pil = self.persistentIndexList()
-        for mil in pil:
-            is_expanded = self.view.isExpanded(mil)
-            if is_expanded:
-                minode = self.nodeFromIndex(mil)
-                expanded_nodes.append(minode)
-        return expanded_nodes
-
-    def expand_items_in_paths(self, expanded_nodes):
-        """Expand all nodes that were previously saved in expanded_nodes"""
-        INDEX = 0  # pylint: disable=invalid-name
-        NODE = 1  # pylint: disable=invalid-name
-        cur_index = QModelIndex()
-        node = self.nodeFromIndex(cur_index)
-        discovered_queue = queue.Queue()
-        discovered_queue.put((cur_index, node))
-
-        while discovered_queue.qsize() > 0:
-            to_check = discovered_queue.get()
-            if to_check[NODE] in expanded_nodes:
-
-                self.view.setExpanded(to_check[INDEX], True)
-
-            # find all children and add them to queue
-            parent_index = to_check[INDEX]
-            new_index = self.index(0, 0, parent_index)  # be valid
-            row = 0
-            while (new_index is not None and new_index.isValid()):
-
-                new_index = self.index(row, 0, parent_index)
-                if new_index is not None and new_index.isValid():
-
-                    new_node = self.nodeFromIndex(new_index)
-                    if isinstance(new_node, BranchNode):
-                        discovered_queue.put((new_index, new_node))
-
-                    row = row + 1
+    def _on_expanded(self, index: QModelIndex):
+        """Remember that the branch at index was expanded in the view"""
+        node = index.internalPointer()
+        if isinstance(node, BranchNode):
+            self._expanded_nodes.add(node)
+
+    def _on_collapsed(self, index: QModelIndex):
+        """Forget the branch at index, which was collapsed in the view"""
+        self._expanded_nodes.discard(index.internalPointer())
 
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: Qt.ItemDataRole):
@@ -779,9 +849,7 @@ class TreeModelParamEntry(QAbstractItemModel):
                     return self.headers[section]
 
             elif role == Qt.FontRole:
-                font = QFont()
-                font.setBold(True)
-                return font
+                return self._bold_font
 
         return None
 
@@ -833,6 +901,19 @@ class TreeModelParamEntry(QAbstractItemModel):
         assert row != -1
         return self.createIndex(row, 0, parent)
 
+    def indexFromNode(self, node: Node) -> QModelIndex:  # pylint: disable=invalid-name
+        """Utility method to get the index of the first column of a node.
+
+        Args:
+            node (Node): A node of the tree
+
+        Returns:
+            QModelIndex: The index, invalid for the root
+        """
+        if node is self.root or node.parent is None:
+            return QModelIndex()
+        return self.createIndex(node.parent.rowOfChild(node), 0, node)
+
     def nodeFromIndex(self, index: QModelIndex) -> Union[BranchNode, LeafNode]:  # pylint: disable=invalid-name
         """Utility method we define to get the node from the index.
 
@@ -868,6 +949,6 @@ class TreeModelParamEntry(QAbstractItemModel):
 
     def node_str(self, node: Node):  # pylint: disable=no-self-use
         """Node to string"""
-        if Node is None:
+        if node is None:
             return "None"
         return str(node)
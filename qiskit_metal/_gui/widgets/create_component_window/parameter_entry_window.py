@@ -30,11 +30,13 @@ QLibrary tab
 """
 
 import copy
+import functools
 import importlib
 import inspect
 import os
 import random
-from collections import OrderedDict
+import sys
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from inspect import signature
 from pathlib import Path
@@ -43,19 +45,130 @@ from typing import TYPE_CHECKING, Union, Type
 import numpy as np
 from PySide2 import QtGui, QtWidgets
 from PySide2.QtCore import Qt
-from PySide2.QtWidgets import QDockWidget, QWidget
-from PySide2.QtWidgets import (QMainWindow, QMessageBox)
+from PySide2.QtWidgets import QDockWidget, QMainWindow, QMessageBox, QWidget
 
 from qiskit_metal import designs
 from qiskit_metal.qlibrary.core import QComponent
 from qiskit_metal.toolbox_python.attr_dict import Dict
 from .model_view.tree_delegate_param_entry import ParamDelegate
-from .model_view.tree_model_param_entry import TreeModelParamEntry, LeafNode, Node
+from .model_view.tree_model_param_entry import TreeModelParamEntry, LeafNode
 from .parameter_entry_window_ui import Ui_MainWindow
 
+try:  # For source doc
+    from pygments import highlight as _highlight
+    from pygments.formatters import HtmlFormatter as _HtmlFormatter
+    from pygments.lexers import get_lexer_by_name as _get_lexer
+    _PYGMENTS_OK = True
+except ImportError:
+    _PYGMENTS_OK = False
+
 if TYPE_CHECKING:
     from ...main_window import MetalGUI
 
+# __init__ parameters that are never shown, and ones only shown with a default
+_IGNORE_PARAMS = frozenset({'self', 'design', 'make', 'kwargs', 'args'})
+_IGNORE_PARAMS_WITHOUT_DEFAULT = frozenset({'options_connection_pads'})
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_init_signature(qcomp_class: Type) -> inspect.Signature:
+    """Signature of the __init__ of qcomp_class, computed once per class"""
+    return signature(qcomp_class.__init__)
+
+
+@functools.lru_cache(maxsize=None)
+def _component_file_path(qcomp_class: Type) -> str:
+    """Path of the file that defines qcomp_class, looked up once per class"""
+    module = sys.modules.get(qcomp_class.__module__)
+    filepath = getattr(module, '__file__', None)
+    if filepath is None:
+        # inspect.getmodule scans sys.modules, so only fall back to it
+        filepath = inspect.getfile(inspect.getmodule(qcomp_class))
+    return filepath
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_class_docs(qcomp_class: Type) -> tuple:
+    """File and docstrings of qcomp_class, looked up once per class
+
+    Returns:
+        tuple: (file path, class docstring, __init__ docstring)
+    """
+    return (_component_file_path(qcomp_class), inspect.getdoc(qcomp_class),
+            inspect.getdoc(qcomp_class.__init__))
+
+
+@functools.lru_cache(maxsize=None)
+def _pygments_tools() -> tuple:
+    """Python lexer, HTML formatter and its style sheet, created once.
+
+    Returns:
+        tuple: (highlight, lexer, formatter, css), or None if pygments is
+        not installed.
+    """
+    if not _PYGMENTS_OK:
+        return None
+
+    formatter = _HtmlFormatter(linenos='inline')
+    return (_highlight, _get_lexer("python", stripall=True), formatter,
+            formatter.get_style_defs('.highlight'))
+
+
+@functools.lru_cache(maxsize=64)
+def _render_source(filepath: str, mtime: float) -> tuple:  # pylint: disable=unused-argument
+    """Read and highlight the source file at filepath.
+
+    mtime is only part of the cache key, so that a file is highlighted again
+    after it changed.
+
+    Args:
+        filepath (str): Path of the python file
+        mtime (float): Modification time of the file
+
+    Returns:
+        tuple: (text, html, css).  html and css are None if pygments
+        is not installed.
+    """
+    # Decode as utf-8 whatever the locale, without failing on stray bytes
+    text = Path(filepath).read_bytes().decode('utf-8', 'replace')
+    tools = _pygments_tools()
+    if tools is None:
+        return text, None, None
+
+    highlight, lexer, formatter, css = tools
+    return text, highlight(text, lexer, formatter), css
+
+
+def _pew_guard(func: Callable):
+    """
+    Throws up critical QMessageBox with current exception in the event an exception is
+    thrown by func
+
+    Args:
+        func (Callable): current function causing exceptions - should  be ONLY  qcpe instance methods
+            because decorators
+        assumes the first argument is a self who has a valid logger
+
+    """
+    message_box = QMessageBox
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        # if anticipated Exception throw up error window
+        except Exception as lqce:
+            self.error_pop_up = message_box()
+
+            error_message = "In function, " + str(func.__name__) + "\n" + str(
+                lqce.__class__.__name__) + ":\n" + str(lqce)
+
+            # modality set by critical, Don't set Title -- will NOT show
+            # up on MacOs¥
+            self.error_pop_up.critical(self, "", error_message)
+
+    return wrapper
+
 
 class ParameterEntryWindow(QMainWindow):
     """Parameter entry window class"""
@@ -101,21 +214,22 @@ class ParameterEntryWindow(QMainWindow):
         self.ui.nest_dictionary_button.pressed.connect(self.add_k_dict_row)
         self.ui.remove_button.pressed.connect(self.delete_row)
 
+        # The help and source tabs are only filled in once they are shown
+        self._help_done = False
+        self._source_done = False
+
     def setup_pew(self):
         """Setup pew"""
         self.generate_model_data()
-        self._setup_help()
-        self._setup_source()
+        tab_widget = self.ui.help_tab_tabWidget
+        tab_widget.currentChanged.connect(self._help_tab_changed)
+        self._help_tab_changed(tab_widget.currentIndex())
 
-    @property
+    @functools.cached_property
     def qcomponent_file_path(self):
         """Get file path to qcomponent
         """
-        component = self.qcomp_class
-        module = inspect.getmodule(component)
-        filepath = inspect.getfile(module)
-        # TypeError
-        return filepath
+        return _component_file_path(self.qcomp_class)
 
     # Exception Handling
     class QComponentParameterEntryExceptionDecorators():
@@ -125,38 +239,25 @@ class ParameterEntryWindow(QMainWindow):
         in QComponentParameterEntry
         """
 
-        @classmethod
-        def entry_exception_pop_up_warning(cls, func: Callable):
-            """
-            Throws up critical QMessageBox with current exception in the event an exception is
-            thrown by func
+        # Kept for code that decorates with the old name; see _pew_guard
+        entry_exception_pop_up_warning = staticmethod(_pew_guard)
 
-            Args:
-                func (Callable): current function causing exceptions - should  be ONLY  qcpe instance methods
-                    because decorators
-                assumes arg[0] is a self who has a valid logger
-
-            """
-
-            def wrapper(*args, **kwargs):
-                try:
+    @_pew_guard
+    def _help_tab_changed(self, index: int):
+        """Set up the help or source tab the first time it is shown
 
-                    return func(*args, **kwargs)
-                # if anticipated Exception throw up error window
-                except (Exception) as lqce:
-
-                    #cls.log_error(args[0], lqce, func, args, kwargs)
-                    args[0].error_pop_up = QMessageBox()
-
-                    error_message = "In function, " + str(
-                        func.__name__) + "\n" + str(
-                            lqce.__class__.__name__) + ":\n" + str(lqce)
-
-                    # modality set by critical, Don't set Title -- will NOT show
-                    # up on MacOs¥
-                    args[0].error_pop_up.critical(args[0], "", error_message)
-
-            return wrapper
+        Args:
+            index (int): Index of the current tab
+        """
+        tab_widget = self.ui.help_tab_tabWidget
+        if index == tab_widget.indexOf(
+                self.ui.tab_help) and not self._help_done:
+            self._help_done = True
+            self._setup_help()
+        elif index == tab_widget.indexOf(
+                self.ui.tab_source) and not self._source_done:
+            self._source_done = True
+            self._setup_source()
 
     def _setup_help(self):
         """Called when we need to set a new help"""
@@ -165,15 +266,15 @@ class ParameterEntryWindow(QMainWindow):
         if component is None:
             raise Exception("No Component found.")
 
-        filepath = self.qcomponent_file_path
+        filepath, doc_class, doc_init = _cached_class_docs(component)
 
         imagefilename = Path(filepath.replace(".py", ".png")).name
         imagepath = Path(
             filepath
         ).parent.parent.parent / "_gui" / "_imgs" / "components" / imagefilename
 
-        doc_class = self.format_docstr(inspect.getdoc(component))
-        doc_init = self.format_docstr(inspect.getdoc(component.__init__))
+        doc_class = self.format_docstr(doc_class)
+        doc_init = self.format_docstr(doc_init)
 
         text = """<body style="color:white;">"""
         text += f'''
@@ -204,7 +305,7 @@ class ParameterEntryWindow(QMainWindow):
         self.ui.tab_help.layout().addWidget(my_help)
 
     # pylint: disable-msg=no-self-use
-    @QComponentParameterEntryExceptionDecorators.entry_exception_pop_up_warning
+    @_pew_guard
     def format_docstr(self, doc: Union[str, None]) -> str:
         """Format a docstring
 
@@ -234,28 +335,15 @@ class ParameterEntryWindow(QMainWindow):
         text_source.setReadOnly(True)
 
         text_doc = QtGui.QTextDocument(text_source)
-        try:  # For source doc
-            #import pygments
-            from pygments import highlight
-            from pygments.formatters import HtmlFormatter
-            from pygments.lexers import get_lexer_by_name
-        except ImportError as e:
+        text, text_html, self._html_css_lex = _render_source(
+            filepath,
+            os.stat(filepath).st_mtime)
+        if text_html is None:
             self._design.logger.error(
-                f'Error: Could not load python package \'pygments\'; Error: {e}'
-            )
-            highlight = None
-            HtmlFormatter = None
-            get_lexer_by_name = None
-
-        text = Path(filepath).read_text()
-        if highlight is None:
+                'Error: Could not load python package \'pygments\'')
             text_doc.setPlainText(text)
         else:
-            lexer = get_lexer_by_name("python", stripall=True)
-            formatter = HtmlFormatter(linenos='inline')
-            self._html_css_lex = formatter.get_style_defs('.highlight')
             text_doc.setDefaultStyleSheet(self._html_css_lex)
-            text_html = highlight(text, lexer, formatter)
             text_doc.setHtml(text_html)
         text_source.moveCursor(QtGui.QTextCursor.Start)
         text_source.ensureCursorVisible()
@@ -277,7 +365,7 @@ class ParameterEntryWindow(QMainWindow):
 
         self.ui.tab_source.layout().addWidget(text_source)
 
-    @QComponentParameterEntryExceptionDecorators.entry_exception_pop_up_warning
+    @_pew_guard
     def add_k_v_row(self):
         """ Add key, value row to parent row based on what row is highlighted in treeview"""
         cur_index = self.ui.qcomponent_param_tree_view.currentIndex()
@@ -286,7 +374,7 @@ class ParameterEntryWindow(QMainWindow):
         value = "value"
         self.model.add_new_leaf_node(cur_index, key, value)
 
-    @QComponentParameterEntryExceptionDecorators.entry_exception_pop_up_warning
+    @_pew_guard
     def add_k_dict_row(self):
         """ Add key, dictionary-value to parent row based on what row is highlighted in treeview"""
         cur_index = self.ui.qcomponent_param_tree_view.currentIndex()
@@ -296,7 +384,7 @@ class ParameterEntryWindow(QMainWindow):
         fakevalue = "value"
         self.model.add_new_branch_node(cur_index, fake_dict, fakekey, fakevalue)
 
-    @QComponentParameterEntryExceptionDecorators.entry_exception_pop_up_warning
+    @_pew_guard
     def delete_row(self):
         """Delete highlight row"""
         cur_index = self.ui.qcomponent_param_tree_view.currentIndex()
@@ -308,11 +396,14 @@ class ParameterEntryWindow(QMainWindow):
         """
 
         param_dict = {}
-        class_signature = signature(self.qcomp_class.__init__)
+        class_signature = _cached_init_signature(self.qcomp_class)
 
         for _, param in class_signature.parameters.items():
             if self.is_param_usable(param):
-                if param.default:
+                # A default of 0, False or '' is still a default; None is
+                # replaced since a None leaf cannot be edited
+                if param.default is not inspect.Parameter.empty and \
+                        param.default is not None:
                     param_dict[param.name] = param.default
                 else:
                     class_name = self.qcomp_class.__name__ if param.name == 'name' else None
@@ -357,17 +448,15 @@ class ParameterEntryWindow(QMainWindow):
     @staticmethod
     def is_param_usable(param):
         """Determines if a given parameter is usable."""
-        ignore_params = {'self', 'design', 'make', 'kwargs', 'args'}
-        if param.name in ignore_params:
+        if param.name in _IGNORE_PARAMS:
             return False
 
-        if_no_default_then_ignore_params = {'options_connection_pads'}
-        if param.name in if_no_default_then_ignore_params:
+        if param.name in _IGNORE_PARAMS_WITHOUT_DEFAULT:
             return param.default is not None
 
         return True
 
-    @QComponentParameterEntryExceptionDecorators.entry_exception_pop_up_warning
+    @_pew_guard
     def instantiate_qcomponent(self):
         """Instantiate self.qcomp_class"""
 
@@ -379,32 +468,32 @@ class ParameterEntryWindow(QMainWindow):
             self._gui.autoscale()
         self.close()
 
-    @QComponentParameterEntryExceptionDecorators.entry_exception_pop_up_warning
+    @_pew_guard
     def traverse_model_to_create_dictionary(self):
         """Traverse model to create parameter entry dictionary given to self.qcomp_class"""
-        parameter_dict = {}
-        r = self.model.root
-        self.recursively_get_params(parameter_dict, r)
-
-        self.current_dict = parameter_dict[""]
-
-    @QComponentParameterEntryExceptionDecorators.entry_exception_pop_up_warning
-    def recursively_get_params(self, parent_dict, cur_node):
-        """Helper function for traverse_model_to_create_dictionary"""
-        try:
-            if isinstance(cur_node, LeafNode):
-                parent_dict[cur_node.name] = cur_node.get_real_value()
-                return
-
-            c_dict = cur_node.get_empty_dictionary()
-            parent_dict[cur_node.name] = c_dict
-            for child in cur_node.children:
+        leaf_node = LeafNode
+        root = self.model.root
+        parameter_dict = root.get_empty_dictionary()
+        stack = deque([(parameter_dict, root)])
+        while stack:
+            c_dict, cur_node = stack.pop()
+            if cur_node.pending_dict is not None:
+                # Never expanded, so its items are the ones it was loaded with
+                c_dict.update(copy.deepcopy(cur_node.pending_dict))
+            for _, child in cur_node.children:
+                try:
+                    if isinstance(child, leaf_node):
+                        c_dict[child.name] = child.get_real_value()
+                    else:
+                        child_dict = child.get_empty_dictionary()
+                        c_dict[child.name] = child_dict
+                        stack.append((child_dict, child))
+                except Exception as e:
+                    raise Exception(
+                        f"Unable to add node:{self.model.node_str(child)} to {c_dict} due to: {e}"
+                    ) from e
 
-                self.recursively_get_params(c_dict, child[Node.NODE])
-        except Exception as e:
-            raise Exception(
-                f"Unable to add node:{self.model.node_str(cur_node)} to {parent_dict} due to: {e}"
-            ) from e
+        self.current_dict = parameter_dict
 
 
 def create_parameter_entry_window(gui: 'MetalGUI',
@@ -478,10 +567,11 @@ def dockify(main_window, docked_title, gui):
     return dock
 
 
+@functools.lru_cache(maxsize=None)
 def get_class_from_abs_file_path(abs_file_path: str):
     """
     Gets the corresponding class object for the absolute file path to the file containing that
-    class definition
+    class definition.  The result is cached per file path.
 
     Args:
         abs_file_path (str): absolute file path to the file containing the QComponent class definition
@@ -499,12 +589,46 @@ def get_class_from_abs_file_path(abs_file_path: str):
                                         '.')  # users cannot use '/' in filename
 
     cur_module = importlib.import_module(qis_mod_path)
-    members = inspect.getmembers(cur_module, inspect.isclass)
     class_owner = qis_mod_path.split('.')[-1]
-    for memtup in members:
-        if len(memtup) > 1:
-            if str(memtup[1].__module__).endswith(class_owner):
-                return memtup[1]
+    # One pass over the module namespace.  inspect.getmembers sorted the
+    # members by name, so keep the match whose name sorts first.
+    members = [(name, value)
+               for name, value in vars(cur_module).items()
+               if isinstance(value, type) and
+               str(value.__module__).endswith(class_owner)]
+    if members:
+        return min(members, key=lambda member: member[0])[1]
+    return None
+
+
+def _fake_param() -> str:
+    """Placeholder string value"""
+    return "fake-param-" + str(random.randint(0, 1000))
+
+
+# Argument type -> function making a default value of that type
+_DEFAULTS_FROM_TYPE = {
+    int:
+        lambda: 0,
+    float:
+        lambda: 0.0,
+    str:
+        _fake_param,
+    bool:
+        lambda: True,
+    # can't have empty branch nodes
+    dict:
+        lambda: {
+            _fake_param(): "fake-param"
+        },
+    OrderedDict:
+        lambda: OrderedDict({0: "zeroth"}),
+    Dict:
+        lambda: Dict(falseparam1=Dict(falseparam2="false-param",
+                                      falseparam3="false-param")),
+    None:
+        _fake_param,
+}
 
 
 def create_default_from_type(my_t: type, param_name: str = None):
@@ -521,24 +645,7 @@ def create_default_from_type(my_t: type, param_name: str = None):
     """
     if param_name is not None:
         return param_name + "-" + str(random.randint(0, 1000))
-    if my_t == int:
-        return 0
-    elif my_t == float:
-        return 0.0
-    elif my_t == str:
-        return "fake-param-" + str(random.randint(0, 1000))
-    elif my_t == bool:
-        return True
-    elif my_t == dict:
-        return {
-            "fake-param-" + str(random.randint(0, 1000)): "fake-param"
-        }  # can't have empty branch nodes
-    elif my_t == OrderedDict:
-        return OrderedDict({0: "zeroth"})
-    elif my_t == Dict:
-        return Dict(falseparam1=Dict(falseparam2="false-param",
-                                     falseparam3="false-param"))
-    elif my_t is None:
-        return "fake-param-" + str(random.randint(0, 1000))
-    else:
+    make_default = _DEFAULTS_FROM_TYPE.get(my_t)
+    if make_default is None:
         return np.ndarray(1)
+    return make_default()
@@ -25,7 +25,7 @@ import shapely
 import shapely.wkt
 from numpy import array
 from numpy.linalg import norm
-from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry import LineString, MultiPolygon, Point, Polygon
 
 from .. import logger
 from .. import is_component
@@ -54,7 +54,40 @@ def get_poly_pts(poly: Polygon):
     Returns:
         np.array: Sequence of coordinates.
     """
-    return np.array(poly.exterior.coords)[:-1]
+    # shapely 2 coordinate sequences convert through the array interface,
+    # without a tuple per point
+    return np.asarray(poly.exterior.coords)[:-1]
+
+
+def _child_geoms_name(root_name: str, name: str) -> str:
+    """Name of the entry `name` below `root_name` in get_all_geoms"""
+    return root_name + '.' + name if not (root_name == '') else name
+
+
+def _geoms_of_geometry(obj, func, root_name):  # pylint: disable=unused-argument
+    """get_all_geoms of a shapely object. This is the bottom of the search
+    tree, so return it"""
+    return obj
+
+
+def _geoms_of_mapping(obj, func, root_name):  # pylint: disable=unused-argument
+    """get_all_geoms of a mapping: the geometries of each of its items"""
+    return {
+        name: get_all_geoms(sub_obj,
+                            root_name=_child_geoms_name(root_name, name))
+        for name, sub_obj in obj.items()
+    }
+
+
+# Handlers of get_all_geoms for the types it meets most, looked up by exact
+# type before the slower checks
+_GEOMS_DISPATCH = {
+    Point: _geoms_of_geometry,
+    LineString: _geoms_of_geometry,
+    Polygon: _geoms_of_geometry,
+    MultiPolygon: _geoms_of_geometry,
+    dict: _geoms_of_mapping,
+}
 
 
 def get_all_geoms(obj, func=lambda x: x, root_name='components'):
@@ -70,11 +103,9 @@ def get_all_geoms(obj, func=lambda x: x, root_name='components'):
     Returns:
         dict: Dictionary of geometries
     """
-
-    # Prelim
-    # Calculate the new name
-    def new_name(name):        return root_name + '.' + \
-name if not (root_name == '') else name
+    handler = _GEOMS_DISPATCH.get(type(obj))
+    if handler is not None:
+        return handler(obj, func, root_name)
 
     # Check what we have
 
@@ -87,29 +118,10 @@ name if not (root_name == '') else name
     #    return {obj.name: obj.geom}  # shapely geom
 
     elif isinstance(obj, BaseGeometry):
-        # Is it the shapely object? This is the bottom of the search tree, then return
-        return obj
+        return _geoms_of_geometry(obj, func, root_name)
 
     elif isinstance(obj, Mapping):
-        return {
-            get_all_geoms(sub_obj, root_name=new_name(name))
-            for name, sub_obj in obj.items()
-        }
-        '''
-        RES = {}
-        for name, sub_obj in obj.items():
-            if is_component(obj):
-                RES[name] = get_all_geoms(
-                    sub_obj.components, root_name=new_name(name))
-            elif isinstance(sub_obj, dict):
-                # if name.startswith('components'): # old school to remove eventually TODO
-                #    RES[name] = func(obj) # allow transformaiton of components
-                # else:
-                RES[name] = get_all_geoms(sub_obj, root_name=new_name(name))
-            elif isinstance(sub_obj, BaseGeometry):
-                RES[name] = func(obj)
-        return RES
-        '''
+        return _geoms_of_mapping(obj, func, root_name)
 
     else:
         logger.debug(
@@ -131,21 +143,45 @@ def flatten_all_filter(components: dict, filter_obj=None):
     assert isinstance(components, dict)
 
     RES = []
-    for name, obj in components.items():
-        if isinstance(obj, dict):
-            RES += flatten_all_filter(obj, filter_obj)
-        else:
-            if filter_obj is None:
-                RES += [obj]  # add whatever we have in here
+    # Depth first, with a stack of the item iterators of the open dicts
+    stack = [iter(components.items())]
+    while stack:
+        for name, obj in stack[-1]:
+            if isinstance(obj, dict):
+                stack.append(iter(obj.items()))
+                break
+            if filter_obj is None or isinstance(obj, filter_obj):
+                RES.append(obj)  # add whatever we have in here
             else:
-                if isinstance(obj, filter_obj):
-                    RES += [obj]
-                else:
-                    print('flatten_all_filter: ', name)
+                print('flatten_all_filter: ', name)
+        else:
+            stack.pop()
 
     return RES
 
 
+def _collect_geoms(obj, out: list, filter_obj=None):
+    """Append to out all shapely objects found in obj, in one walk.
+
+    Same result as ``flatten_all_filter(get_all_geoms(obj), filter_obj)``,
+    without building the intermediate dict of dict.
+
+    Args:
+        obj (dict, geometry, component): Object to get from.
+        out (list): List that the geometries are appended to.
+        filter_obj (class): Only keep instances of this class.  Defaults to None.
+    """
+    if is_component(obj):
+        obj = obj.get_all_geom()
+
+    if isinstance(obj, BaseGeometry):
+        if filter_obj is None or isinstance(obj, filter_obj):
+            out.append(obj)
+    elif isinstance(obj, Mapping):
+        for sub_obj in obj.values():
+            _collect_geoms(sub_obj, out, filter_obj)
+
+
 def get_all_component_bounds(components: dict, filter_obj=Polygon):
     """Pass in a dict of components to calculate the total bounding box.
 
@@ -159,10 +195,15 @@ def get_all_component_bounds(components: dict, filter_obj=Polygon):
     """
     assert isinstance(components, dict)
 
-    components = get_all_geoms(components)
-    components = flatten_all_filter(components, filter_obj=filter_obj)
+    geoms = []
+    _collect_geoms(components, geoms, filter_obj)
+    if not geoms:
+        return MultiPolygon().bounds
 
-    (x_min, y_min, x_max, y_max) = MultiPolygon(components).bounds
+    # Reduce the bounds of each geometry rather than building a MultiPolygon
+    bounds = np.array([geom.bounds for geom in geoms])
+    x_min, y_min = bounds[:, :2].min(axis=0).tolist()
+    x_max, y_max = bounds[:, 2:].max(axis=0).tolist()
 
     return (x_min, y_min, x_max, y_max)
 
@@ -213,41 +254,62 @@ def array_chop(vec, zero=0, rtol=0, machine_tol=100):
         array: Chopped array
     """
     vec = np.array(vec)
-    mask = np.isclose(vec,
-                      zero,
-                      rtol=rtol,
-                      atol=machine_tol * np.finfo(float).eps)
-    vec[mask] = 0
+    # same test as np.isclose(vec, zero), without its broadcasting machinery
+    tol = machine_tol * np.finfo(float).eps + rtol * abs(zero)
+    vec[np.abs(vec - zero) <= tol] = 0
     return vec
 
 
+def _is_parallel(v1, v2, tol=100 * np.finfo(float).eps):
+    """Check if 2D vectors are parallel (or anti-parallel) from their cross
+    product, without computing the angle between them.
+
+    Args:
+        v1 (array): 2D vector, or array of 2D vectors
+        v2 (array): 2D vector, or array of 2D vectors
+        tol (float): Tolerance on the sine of the angle.  Defaults to 100
+                     machine epsilons.
+
+    Returns:
+        bool or array: Parallel or not, for each pair of vectors
+    """
+    v1, v2 = np.asarray(v1), np.asarray(v2)
+    cross = v1[..., 0] * v2[..., 1] - v1[..., 1] * v2[..., 0]
+    return np.abs(cross) <= tol * norm(v1, axis=-1) * norm(v2, axis=-1)
+
+
 def remove_colinear_pts(points):
     """Remove colinear points and identical consecqutive points.
 
+    A middle point is colinear when the segments before and after it point
+    in the same direction.
+
     Args:
-        points (array): Array of points
+        points (array): Array of 2D points
 
     Returns:
         ndarray: A copy of the input array without colinear points
     """
-    remove_idx = []
-    for i in range(2, len(points)):
-        v1 = array(points[i - 2]) - array(points[i - 1])
-        v2 = array(points[i - 1]) - array(points[i - 0])
-        if Vector.are_same(v1, v2):
-            remove_idx += [i - 1]
-        elif Vector.angle_between(v1, v2) == 0:
-            remove_idx += [i - 1]
-    points = np.delete(points, remove_idx, axis=0)
-
-    # remove  consecutive duplicates
-    remove_idx = []
-    for i in range(1, len(points)):
-        if norm(points[i] - points[i - 1]) == 0:
-            remove_idx += [i]
-    points = np.delete(points, remove_idx, axis=0)
-
-    return points
+    points = np.asarray(points)
+    tol = 100 * np.finfo(float).eps
+    keep = np.ones(len(points), dtype=bool)
+
+    if len(points) > 2:
+        seg = np.diff(points, axis=0)
+        seg_a, seg_b = seg[:-1], seg[1:]
+        dot = np.einsum('ij,ij->i', seg_a, seg_b)
+        colinear = _is_parallel(seg_a, seg_b, tol) & (dot > 0)
+        # two identical segments, including two of zero length
+        colinear |= norm(seg_a - seg_b, axis=1) < tol
+        keep[1:-1] = ~colinear
+
+    # remove  consecutive duplicates among the points kept so far
+    kept = np.flatnonzero(keep)
+    if len(kept) > 1:
+        same = norm(points[kept[1:]] - points[kept[:-1]], axis=1) == 0
+        keep[kept[1:][same]] = False
+
+    return points[keep]
 
 
 #########################################################################
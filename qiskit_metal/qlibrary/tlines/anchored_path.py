@@ -26,6 +26,72 @@ from shapely.geometry import CAP_STYLE
 import geopandas as gpd
 
 
+def manhattan_length(points) -> float:
+    """Returns the manhattan length of the polyline through the given points,
+    i.e. the sum of |dx| + |dy| over consecutive points.
+
+    .. meta::
+        Anchored Path
+
+    Args:
+        points (array-like): (N,2) sequence of coordinates
+
+    Returns:
+        float: Total length connecting all points in order
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) < 2:
+        return 0.
+    return float(np.abs(np.diff(points, axis=0)).sum())
+
+
+def append_point(pts, point):
+    """Returns the (N+1,2) array made of `pts` followed by `point`.
+
+    .. meta::
+        Anchored Path
+
+    Args:
+        pts (np.ndarray): (N,2) array of points
+        point (np.ndarray): Point to append
+
+    Returns:
+        np.ndarray: New (N+1,2) array of float
+    """
+    out = np.empty((len(pts) + 1, 2), dtype=float)
+    out[:-1] = pts
+    out[-1] = point
+    return out
+
+
+def join_segments(segments):
+    """Joins the per-segment point arrays into a single (N,2) array, copying
+    each segment exactly once.
+
+    .. meta::
+        Anchored Path
+
+    Args:
+        segments (Mapping): Segment ID -> (n_i,2) array-like of points
+
+    Returns:
+        tuple: (sum(n_i),2) array of float, and a dict of
+        segment ID -> slice of the rows of that segment in the array
+    """
+    segments = {
+        key: np.asarray(seg, dtype=float) for key, seg in segments.items()
+    }
+    out = np.empty((sum(len(seg) for seg in segments.values()), 2), dtype=float)
+    rows = {}
+    start = 0
+    for key, seg in segments.items():
+        stop = start + len(seg)
+        out[start:stop] = seg
+        rows[key] = slice(start, stop)
+        start = stop
+    return out, rows
+
+
 def intersecting(a: np.array, b: np.array, c: np.array, d: np.array) -> bool:
     """Returns whether segment ab intersects or overlaps with segment cd, where
     a, b, c, and d are all coordinates.
@@ -343,13 +409,7 @@ class RouteAnchors(QRoute):
         reference = [self.head.get_tip().position]
         reference.extend(list(anchors.values()))
         reference.append(self.tail.get_tip().position)
-
-        length = 0
-        for i in range(1, len(reference)):
-            length += abs(reference[i][0] -
-                          reference[i - 1][0]) + abs(reference[i][1] -
-                                                     reference[i - 1][1])
-        return length
+        return manhattan_length(reference)
 
     def trim_pts(self):
         """Crops the sequence of points to concatenate.
@@ -394,17 +454,14 @@ class RouteAnchors(QRoute):
             if arc_pts is None:
                 self.intermediate_pts[arc_num] = [coord]
             else:
-                self.intermediate_pts[arc_num] = np.concatenate(
-                    [arc_pts, [coord]], axis=0)
+                self.intermediate_pts[arc_num] = append_point(arc_pts, coord)
         arc_pts = self.connect_simple(self.get_tip(), end_point)
         if arc_pts is not None:
             self.intermediate_pts[len(anchors)] = np.array(arc_pts)
 
         # concatenate all points, transforming the dictionary into a single numpy array
         self.trim_pts()
-        self.intermediate_pts = np.concatenate(list(
-            self.intermediate_pts.values()),
-                                               axis=0)
+        self.intermediate_pts, _ = join_segments(self.intermediate_pts)
 
         # Make points into elements
         self.make_elements(self.get_points())
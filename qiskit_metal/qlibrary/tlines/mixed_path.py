@@ -12,11 +12,13 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+from collections import OrderedDict
+
 import numpy as np
 from qiskit_metal import Dict
 from qiskit_metal.qlibrary.core import QRoutePoint
 
-from collections import OrderedDict
+from .anchored_path import append_point, join_segments, manhattan_length
 from .meandered import RouteMeander
 from .pathfinder import RoutePathfinder
 
@@ -98,11 +100,24 @@ class RouteMixed(RoutePathfinder, RouteMeander):
     TOOLTIP = """Implements fully featured Routing, allowing different type of
     connections between anchors."""
 
+    # between_anchors value -> name of the method that connects the segment
+    _CONNECT_METHODS = {
+        "S": "connect_simple",
+        "PF": "connect_astar_or_simple",
+        "M": "connect_meandered"
+    }
+
     def make(self):
         """Generates path from start pin to end pin."""
         p = self.parse_options()
         anchors = p.anchors
         between_anchors = p.between_anchors
+        # stage the anchor coordinates once, as rows of a single array
+        anchor_index = {key: i for i, key in enumerate(anchors)}
+        anchor_arr = np.asarray(list(anchors.values()),
+                                dtype=np.float64).reshape(-1, 2)
+        # number of the final segment, into the lead-out
+        n_anchors = len(anchors)
 
         # Set the CPW pins and add the points/directions to the lead-in/out arrays
         self.set_pin("start")
@@ -114,91 +129,102 @@ class RouteMixed(RoutePathfinder, RouteMeander):
 
         # approximate length needed for individual meanders
         # the meander algorithm directly reads from self._length_segment
-        count_meanders_list = [
-            1 if x == "M" else 0 for x in list(between_anchors.values())
-        ]
+        between_types = tuple(between_anchors.values())
+        meander_count = between_types.count("M")
+        # connection type of each segment in route order: one segment per
+        # anchor, plus the final one into the lead-out
+        segment_nums = (*anchor_index, n_anchors)
+        segment_types = tuple(
+            between_anchors.get(num, "S") for num in segment_nums)
+        meanders = {
+            num for num, type_connect in zip(segment_nums, segment_types)
+            if type_connect == "M"
+        }
+        # determine the connection strategy of each segment, based on user inputs
+        methods = {
+            type_connect: getattr(self, name)
+            for type_connect, name in self._CONNECT_METHODS.items()
+        }
+        connect_methods = tuple(
+            methods.get(type_connect) for type_connect in segment_types)
         self._length_segment = None
-        if any(count_meanders_list):
+        if meander_count:
+            # same as free_manhattan_length_anchors(), on the staged anchors
+            free_length = manhattan_length([
+                self.head.get_tip().position, *anchor_arr,
+                self.tail.get_tip().position
+            ])
             self._length_segment = ((self.p.total_length - (self.head.length + self.tail.length) \
-                                   - self.free_manhattan_length_anchors()) / sum(count_meanders_list)) \
-                                   + (self.free_manhattan_length_anchors() / len(count_meanders_list))
+                                   - free_length) / meander_count) \
+                                   + (free_length / len(between_types))
 
         # find the points to connect between each pair of anchors, or between anchors and leads
         # at first, store points "per segment" in a dictionary, so it is easier to apply length requirements
         self.intermediate_pts = OrderedDict()
-        meanders = set()
-        for arc_num, coord in anchors.items():
-            # determine what is the connection strategy for this pair, based on user inputs
-            connect_method = self.select_connect_method(arc_num)
-            if connect_method == self.connect_meandered:
-                meanders.add(arc_num)
+        for arc_num, i in anchor_index.items():
+            coord = anchor_arr[i]
             # compute points connecting the anchors, all but the last
-            arc_pts = connect_method(self.get_tip(), QRoutePoint(coord))
+            arc_pts = connect_methods[i](self.get_tip(), QRoutePoint(coord))
             if arc_pts is None:
-                self.intermediate_pts[arc_num] = [coord]
+                self.intermediate_pts[arc_num] = anchor_arr[i:i + 1]
             else:
-                self.intermediate_pts[arc_num] = np.concatenate(
-                    [arc_pts, [coord]], axis=0)
+                self.intermediate_pts[arc_num] = append_point(arc_pts, coord)
         # compute last connection point to the output QRouteLead
-        connect_method = self.select_connect_method(len(anchors))
-        if connect_method == self.connect_meandered:
-            meanders.add(len(anchors))
-        arc_pts = connect_method(self.get_tip(), end_point)
-        if arc_pts is not None:
-            self.intermediate_pts[len(anchors)] = np.array(arc_pts)
+        arc_pts = connect_methods[-1](self.get_tip(), end_point)
+        # every anchor segment holds at least its anchor, so this is the only
+        # segment that can be empty; leaving it out replaces self.trim_pts()
+        if arc_pts is not None and len(arc_pts):
+            self.intermediate_pts[n_anchors] = np.array(arc_pts)
 
         # concatenate all points, transforming the dictionary into a single numpy array
-        self.trim_pts()
-        dictionary_intermediate_pts = self.intermediate_pts
-        self.intermediate_pts = np.concatenate(list(
-            self.intermediate_pts.values()),
-                                               axis=0)
+        self.intermediate_pts, segment_rows = join_segments(
+            self.intermediate_pts)
 
-        if any(count_meanders_list):
+        if meander_count:
             # refine length of meanders
             total_delta_length = self.p.total_length - self.length
             individual_delta_length = total_delta_length / len(meanders)
             for m in meanders:
-                arc_pts = dictionary_intermediate_pts[m][:-1]
+                if m not in segment_rows:
+                    # empty final segment: nothing to meander
+                    continue
                 if m == 0:
                     meander_start_point = start_point
                 else:
-                    meander_start_point = QRoutePoint(anchors[m - 1])
-                if m == len(anchors):
+                    meander_start_point = QRoutePoint(
+                        anchor_arr[anchor_index[m - 1]])
+                rows = segment_rows[m]
+                if m == n_anchors:
                     meander_end_point = end_point
                 else:
-                    meander_end_point = QRoutePoint(anchors[m])
-                dictionary_intermediate_pts[m] = self.adjust_length(
-                    individual_delta_length, arc_pts, meander_start_point,
-                    meander_end_point)
-                dictionary_intermediate_pts[m] = np.concatenate(
-                    [dictionary_intermediate_pts[m], [anchors[m]]], axis=0)
-        self.intermediate_pts = np.concatenate(list(
-            dictionary_intermediate_pts.values()),
-                                               axis=0)
+                    meander_end_point = QRoutePoint(anchor_arr[anchor_index[m]])
+                    # leave out the anchor closing the segment
+                    rows = slice(rows.start, rows.stop - 1)
+                # adjust_length keeps the point count, so write the refined
+                # meander straight back into the joined float64 array
+                self.intermediate_pts[rows] = self.adjust_length(
+                    individual_delta_length, self.intermediate_pts[rows],
+                    meander_start_point, meander_end_point)
 
         # Make points into elements
         self.make_elements(self.get_points())
 
-    def select_connect_method(self, segment_num):
+    def select_connect_method(self, segment_num, between_anchors=None):
         """Translates the user-selected connection method into the right method
         to execute.
 
         Args:
             segment_num (int): Segment ID. Counts 0 as the first segment after the lead-in.
+            between_anchors (OrderedDict): Parsed `between_anchors` option.
+                Parsed from the options if not given.
 
         Return:
             object: selected method
         """
-        between_anchors = self.parse_options().between_anchors
-        if segment_num in between_anchors:
-            type_connect = between_anchors[segment_num]
-        else:
-            type_connect = "S"
-        # print(type_connect)
-        if type_connect == "S":
-            return self.connect_simple
-        if type_connect == "PF":
-            return self.connect_astar_or_simple
-        if type_connect == "M":
-            return self.connect_meandered
+        if between_anchors is None:
+            between_anchors = self.parse_options().between_anchors
+        type_connect = between_anchors.get(segment_num, "S")
+        method_name = self._CONNECT_METHODS.get(type_connect)
+        if method_name is None:
+            return None
+        return getattr(self, method_name)
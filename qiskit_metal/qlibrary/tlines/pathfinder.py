@@ -16,7 +16,7 @@ import heapq
 import numpy as np
 from qiskit_metal import Dict
 from qiskit_metal.qlibrary.core import QRoutePoint
-from .anchored_path import RouteAnchors
+from .anchored_path import RouteAnchors, append_point, join_segments
 from qiskit_metal.toolbox_metal import math_and_overrides as mao
 from collections import OrderedDict
 from qiskit_metal.toolbox_metal.exceptions import QiskitMetalDesignError
@@ -178,17 +178,14 @@ class RoutePathfinder(RouteAnchors):
             if arc_pts is None:
                 self.intermediate_pts[arc_num] = [coord]
             else:
-                self.intermediate_pts[arc_num] = np.concatenate(
-                    [arc_pts, [coord]], axis=0)
+                self.intermediate_pts[arc_num] = append_point(arc_pts, coord)
         arc_pts = self.connect_astar_or_simple(self.get_tip(), end_point)
         if arc_pts is not None:
             self.intermediate_pts[len(anchors)] = np.array(arc_pts)
 
         # concatenate all points, transforming the dictionary into a single numpy array
         self.trim_pts()
-        self.intermediate_pts = np.concatenate(list(
-            self.intermediate_pts.values()),
-                                               axis=0)
+        self.intermediate_pts, _ = join_segments(self.intermediate_pts)
 
         # Make points into elements
         self.make_elements(self.get_points())
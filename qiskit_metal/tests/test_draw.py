@@ -391,6 +391,20 @@ class TestDraw(unittest.TestCase, AssertionsMixin):
                                           expected[i][j],
                                           rel_tol=1e-3)
 
+    def test_draw_utility_get_all_component_bounds(self):
+        """Test get_all_component_bounds in utility.py."""
+        poly_1 = Polygon([(0, 0), (0.5, 0), (0.25, 0.5)])
+        poly_2 = Polygon([(1, 1), (1.5, 1), (1.25, 2.5)])
+        line = LineString([(-5, -5), (5, 5)])
+        my_dict = {'first': {'poly': poly_1, 'line': line}, 'second': poly_2}
+
+        actual = utility.get_all_component_bounds(my_dict)
+        self.assertEqual(actual, (0.0, 0.0, 1.5, 2.5))
+
+        actual = utility.get_all_geoms(my_dict)
+        self.assertEqual(actual['first']['poly'], poly_1)
+        self.assertEqual(actual['second'], poly_2)
+
     def test_draw_utility_flatten_all_filter(self):
         """Test flatten_all_filter in utility.py."""
         poly_1 = Polygon([(0, 0), (0.5, 0), (0.25, 0.5)])
@@ -437,6 +451,10 @@ class TestDraw(unittest.TestCase, AssertionsMixin):
         for i in range(my_range):
             self.assertAlmostEqualRel(actual[i], expected[i], rel_tol=1e-3)
 
+        actual = utility.array_chop([3, 1, -1, 1], zero=1)
+        self.assertEqual(actual.dtype, np.array([1]).dtype)
+        self.assertEqual(actual.tolist(), [3, 0, -1, 0])
+
     def test_draw_utility_remove_colinear_pts(self):
         """Test remove_colinear_pts in utility.py."""
         points_list = [[0, 0], [
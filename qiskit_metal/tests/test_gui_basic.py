@@ -19,9 +19,20 @@
 Test a planar design and launching the GUI.
 """
 
+import logging
 import unittest
+from types import SimpleNamespace
+
+import pandas as pd
+from PySide2.QtCore import QCoreApplication, QModelIndex
+
+from qiskit_metal import designs
+from qiskit_metal._gui.elements_window import ElementFilterProxyModel
+from qiskit_metal._gui.elements_window import ElementTableModel
 from qiskit_metal._gui.widgets.bases.dict_tree_base import BranchNode
 from qiskit_metal._gui.widgets.bases.dict_tree_base import LeafNode
+from qiskit_metal._gui.widgets.create_component_window.model_view import \
+    tree_model_param_entry
 
 
 class TestGUIBasic(unittest.TestCase):
@@ -51,6 +62,148 @@ class TestGUIBasic(unittest.TestCase):
             message = "LeafNode instantiation failed"
             self.fail(message)
 
+    def test_param_entry_branch_node_children(self):
+        """Test the child lookups of BranchNode in tree_model_param_entry.py."""
+        branch = tree_model_param_entry.BranchNode('options')
+        first = tree_model_param_entry.LeafNode('pos_x', '1um')
+        second = tree_model_param_entry.LeafNode('pos_y', '2um')
+        branch.insertChild(first)
+        branch.insertChild(second)
+
+        self.assertEqual(branch.childWithKey('pos_y'), second)
+        self.assertEqual(branch.rowOfChild(second), 1)
+        self.assertEqual(branch.childAtRow(0), first)
+
+        second.update_name('pos_z')
+        self.assertIsNone(branch.childWithKey('pos_y'))
+        self.assertEqual(branch.childWithKey('pos_z'), second)
+
+        del branch.children[0]
+        branch.reindex()
+        self.assertEqual(branch.rowOfChild(second), 0)
+        self.assertEqual(branch.rowOfChild(first), -1)
+
+        branch.insertChild(first)
+        branch.removeChild(0)
+        self.assertEqual(branch.rowOfChild(first), 0)
+        self.assertIsNone(branch.childWithKey('pos_z'))
+        self.assertEqual(branch.childWithKey('pos_x'), first)
+
+    def test_param_entry_bool_leaf(self):
+        """Test parsing the value of a bool leaf in tree_model_param_entry.py."""
+        leaf = tree_model_param_entry.LeafNode('chip', True)
+        self.assertEqual(leaf.value, 'True')
+        self.assertTrue(leaf.get_real_value())
+
+        for text, expected in [(' yes ', True), ('1', True), ('False', False),
+                               ('', False), ('ru', False)]:
+            leaf.value = text
+            self.assertEqual(leaf.get_real_value(), expected)
+
+    def test_param_entry_parsed_variable(self):
+        """Test parsing a leaf value that refers to a design variable in
+        tree_model_param_entry.py."""
+        design = designs.DesignPlanar()
+        design.variables.cpw_width = '10um'
+        leaf = tree_model_param_entry.LeafNode('width', 'cpw_width')
+        self.assertAlmostEqual(leaf.get_parsed_value(design), 0.01)
+
+        design.variables.cpw_width = '15um'
+        self.assertAlmostEqual(leaf.get_parsed_value(design), 0.015)
+        self.assertEqual(leaf.get_parsed_text(design),
+                         str(leaf.get_parsed_value(design)))
+
+    def test_param_entry_collapsed_branch(self):
+        """Test a branch of the tree model in tree_model_param_entry.py before
+        and after it is expanded."""
+        model = tree_model_param_entry.TreeModelParamEntry(
+            None, None, {
+                'pos_x': '1um',
+                'options': {
+                    'pad_width': '10um',
+                    'pad_height': '20um'
+                }
+            })
+
+        branch_index = model.index(1, model.NAME, QModelIndex())
+        type_index = model.index(1, model.TYPE, QModelIndex())
+        self.assertEqual(model.data(branch_index), 'options')
+        self.assertEqual(model.data(type_index), 'dict')
+        self.assertTrue(model.hasChildren(branch_index))
+        self.assertEqual(model.rowCount(branch_index), 0)
+
+        self.assertTrue(model.canFetchMore(branch_index))
+        model.fetchMore(branch_index)
+        self.assertFalse(model.canFetchMore(branch_index))
+        self.assertEqual(model.rowCount(branch_index), 2)
+        leaf_index = model.index(1, model.VALUE, branch_index)
+        self.assertEqual(model.data(leaf_index), '20um')
+
+    def test_param_entry_delete_expanded_branch(self):
+        """Test deleting an expanded branch of the tree model in
+        tree_model_param_entry.py."""
+        model = tree_model_param_entry.TreeModelParamEntry(
+            None, None, {
+                'pos_x': '1um',
+                'options': {
+                    'pad_width': '10um',
+                    'pad': {
+                        'gap': '5um'
+                    }
+                }
+            })
+        branch_index = model.index(1, model.NAME, QModelIndex())
+        model.fetchMore(branch_index)
+        nested_index = model.index(1, model.NAME, branch_index)
+        model.fetchMore(nested_index)
+        model._on_expanded(branch_index)
+        model._on_expanded(nested_index)
+
+        model.delete_node(branch_index)
+        self.assertEqual(model.rowCount(QModelIndex()), 1)
+        self.assertEqual(model._expanded_nodes, set())
+
+    def test_element_filter_unfetched_rows(self):
+        """Test filtering rows of the element table in elements_window.py
+        that are not fetched yet."""
+        _ = QCoreApplication.instance() or QCoreApplication([])
+        table = pd.DataFrame({
+            'component': range(1000),
+            'name': [f'pad_{i}' for i in range(1000)],
+            'layer': [1] * 1000
+        })
+        design = SimpleNamespace(qgeometry=SimpleNamespace(
+            tables={'poly': table}))
+        gui = SimpleNamespace(logger=logging.getLogger(__name__), design=design)
+        model = ElementTableModel(gui)
+        proxy = ElementFilterProxyModel()
+        proxy.setSourceModel(model)
+        self.assertLess(model.rowCount(), 1000)
+
+        proxy.set_filters({1: 'pad_99?'})
+        self.assertEqual(proxy.rowCount(), 10)
+        self.assertEqual(proxy.data(proxy.index(0, 1)), 'pad_990')
+        self.assertFalse(model.canFetchMore(QModelIndex()))
+
+        proxy.set_filters({1: ''})
+        self.assertEqual(proxy.rowCount(), 1000)
+
+    def test_element_table_rows_added_in_place(self):
+        """Test the columns of the element table model in elements_window.py
+        after rows are added to the table in place."""
+        _ = QCoreApplication.instance() or QCoreApplication([])
+        table = pd.DataFrame({'component': [1, 2], 'name': ['pad', 'pin']})
+        design = SimpleNamespace(qgeometry=SimpleNamespace(
+            tables={'poly': table}))
+        gui = SimpleNamespace(logger=logging.getLogger(__name__), design=design)
+        model = ElementTableModel(gui)
+        self.assertEqual(model.data(model.index(1, 1)), 'pin')
+
+        table.loc[2] = [3, 'gap']
+        model.refresh_auto()
+        self.assertEqual(model.rowCount(), 3)
+        self.assertEqual(model.data(model.index(2, 1)), 'gap')
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -38,6 +38,7 @@ from qiskit_metal.qlibrary.tlines import anchored_path
 from qiskit_metal.qlibrary.tlines.anchored_path import RouteAnchors
 from qiskit_metal.qlibrary.tlines.framed_path import RouteFramed
 from qiskit_metal.qlibrary.tlines.meandered import RouteMeander
+from qiskit_metal.qlibrary.tlines.mixed_path import RouteMixed
 from qiskit_metal.qlibrary.tlines import straight_path
 from qiskit_metal import designs
 from qiskit_metal.qlibrary.qubits import star_qubit
@@ -548,6 +549,71 @@ class TestComponentFunctionality(unittest.TestCase, AssertionsMixin):
             anchored_path.intersecting(np.array([1, 1]), np.array([3, 3]),
                                        np.array([5, 5]), np.array([7, 7])))
 
+    def test_qlibrary_anchored_path_manhattan_length(self):
+        """Test manhattan_length function in anchored_path.py"""
+        self.assertEqual(anchored_path.manhattan_length([]), 0)
+        self.assertEqual(anchored_path.manhattan_length([np.array([1, 1])]), 0)
+        self.assertAlmostEqual(
+            anchored_path.manhattan_length(
+                [np.array([0, 0]),
+                 np.array([1, -2]),
+                 np.array([-1.5, 0.5])]), 8)
+
+    def test_qlibrary_anchored_path_join_segments(self):
+        """Test join_segments function in anchored_path.py"""
+        segments = {
+            0: [np.array([1, 2])],
+            1:
+                anchored_path.append_point(np.array([[3, 4], [5, 6]]),
+                                           np.array([7, 8]))
+        }
+        joined, rows = anchored_path.join_segments(segments)
+        self.assertEqual(joined.tolist(), [[1, 2], [3, 4], [5, 6], [7, 8]])
+        self.assertEqual(joined[rows[1]].tolist(), [[3, 4], [5, 6], [7, 8]])
+
+    def test_qlibrary_mixed_path_segments(self):
+        """Test the points and length of a RouteMixed in mixed_path.py that
+        mixes all the connection types and ends with a meander."""
+        design = designs.DesignPlanar()
+        pads = dict(connection_pads=dict(a=dict(loc_W=+1, loc_H=+1)))
+        transmon_pocket.TransmonPocket(design,
+                                       'Q1',
+                                       options=dict(pos_x='-1.5mm', **pads))
+        transmon_pocket.TransmonPocket(design,
+                                       'Q2',
+                                       options=dict(pos_x='1.5mm',
+                                                    pos_y='1mm',
+                                                    orientation='180',
+                                                    **pads))
+        options = Dict(total_length='6mm', fillet='50um')
+        options.pin_inputs.start_pin = Dict(component='Q1', pin='a')
+        options.pin_inputs.end_pin = Dict(component='Q2', pin='a')
+        options.lead.start_straight = '100um'
+        options.lead.end_straight = '100um'
+        options.anchors = {
+            0: np.array([-0.5, 0.5]),
+            1: np.array([-0.5, 1.5]),
+            2: np.array([0.0, 1.5])
+        }
+        options.between_anchors = {0: 'S', 1: 'M', 2: 'PF', 3: 'M'}
+        route = RouteMixed(design, 'route', options=options)
+
+        # A meander between the anchors 0 and 1, and one into the lead-out
+        expected_x = [
+            -1.075, -0.5, -0.5, -0.358552606, -0.358552606, -0.641447394,
+            -0.641447394, -0.358552606, -0.358552606, -0.641447394,
+            -0.641447394, 0.0, 0.0, 0.2, 0.2, 0.4, 0.4, 0.6, 0.6, 1.075
+        ]
+        expected_y = [
+            0.195, 0.195, 0.7, 0.7, 0.9, 0.9, 1.1, 1.1, 1.3, 1.3, 1.5, 1.5,
+            1.684117359, 1.684117359, 1.315882641, 1.315882641, 1.684117359,
+            1.684117359, 0.805, 0.805
+        ]
+        points = route.get_points()
+        self.assertIterableAlmostEqual(expected_x, points[:, 0], abs_tol=1e-6)
+        self.assertIterableAlmostEqual(expected_y, points[:, 1], abs_tol=1e-6)
+        self.assertAlmostEqual(route.length, 6.0)
+
     @staticmethod
     def generate_spiral_list(x: int, y: int):
         """Helper function to generate a sprital list.